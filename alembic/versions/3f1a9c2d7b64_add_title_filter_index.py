@@ -0,0 +1,38 @@
+"""Add a composite index for filtering titles
+
+Revision ID: 3f1a9c2d7b64
+Revises: b88e2ac374af
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1a9c2d7b64"
+down_revision: Union[str, None] = "b88e2ac374af"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_title_filter",
+            "title",
+            ["type_id", "rating", "votes"],
+            unique=False,
+            postgresql_include=["id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_title_filter", table_name="title", postgresql_concurrently=True
+        )
@@ -0,0 +1,41 @@
+"""Add an index for looking up titles by genre
+
+Revision ID: 5c7e2b8d9a13
+Revises: 3f1a9c2d7b64
+Create Date: 2026-10-16 12:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c7e2b8d9a13"
+down_revision: Union[str, None] = "3f1a9c2d7b64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_title_genre_genre_id_title_id",
+            "title_genre",
+            ["genre_id", "title_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_title_genre_genre_id_title_id",
+            table_name="title_genre",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,51 @@
+"""Drop title indexes covered by ix_title_filter
+
+Revision ID: 7a2d4e6f1b85
+Revises: 5c7e2b8d9a13
+Create Date: 2026-10-16 12:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2d4e6f1b85"
+down_revision: Union[str, None] = "5c7e2b8d9a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every suggestion filters by type, rating and votes together, which is served by
+# ix_title_filter on (type_id, rating, votes).
+indexes = [
+    ("ix_title_type_id", ["type_id"]),
+    ("ix_title_rating", ["rating"]),
+    ("ix_title_votes", ["votes"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, _ in indexes:
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                op.f(index_name),
+                table_name="title",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name, columns in indexes:
+        with op.get_context().autocommit_block():
+            op.create_index(
+                op.f(index_name),
+                "title",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
@@ -1,3 +1,5 @@
+import asyncio
+import operator
 from collections.abc import AsyncIterable
 from typing import AsyncGenerator
 
@@ -8,6 +10,10 @@ async def zip_on_same_ordered_attribute[T1, T2](
     """Zip two async iterables matching values in pairs by the given attribute.
     Both iterables must be ordered by the attribute.
 
+    It's a merge join for data that isn't in the database yet (e.g. the IMDB
+    datasets being imported). Data that is already in the database should be
+    joined in SQL instead.
+
     :param iterable1: The first async iterable.
     :param iterable2: The second async iterable.
     :param attribute: The name of the attribute to compare.
@@ -17,6 +23,7 @@ async def zip_on_same_ordered_attribute[T1, T2](
 
     it1 = aiter(iterable1)
     it2 = aiter(iterable2)
+    get_attribute = operator.attrgetter(attribute)
 
     # Consume the first items from both iterators
     try:
@@ -28,8 +35,8 @@ async def zip_on_same_ordered_attribute[T1, T2](
     # Items are expected to be ordered by the attribute. That's why consume
     # the lower one until they are equal. Then yield the two items and continue.
     while True:
-        attr1 = getattr(item1, attribute)
-        attr2 = getattr(item2, attribute)
+        attr1 = get_attribute(item1)
+        attr2 = get_attribute(item2)
         if attr1 < attr2:
             try:
                 item1 = await anext(it1)
@@ -42,8 +49,35 @@ async def zip_on_same_ordered_attribute[T1, T2](
                 return
         else:
             yield item1, item2
-            try:
-                item1 = await anext(it1)
-                item2 = await anext(it2)
-            except StopAsyncIteration:
-                return
+            # Both iterators have to be advanced, so let them do it concurrently.
+            results = await asyncio.gather(
+                anext(it1), anext(it2), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, StopAsyncIteration):
+                    return
+                if isinstance(result, BaseException):
+                    raise result
+            item1, item2 = results
+
+
+async def batched[T](iterable: AsyncIterable[T], n: int) -> AsyncGenerator[list[T]]:
+    """Batch items of an async iterable into lists of length ``n``. The last
+    batch may be shorter.
+
+    :param iterable: The async iterable.
+    :param n: The size of the batches.
+    :return: An async generator yielding the batches.
+    """
+
+    if n < 1:
+        raise ValueError("n must be at least one")
+
+    batch: list[T] = []
+    async for item in iterable:
+        batch.append(item)
+        if len(batch) == n:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -12,6 +12,14 @@ from app.bot import middlewares, scenes
 from app.bot.routers import common, extra, test
 
 
+# Use bot id in key builder to avoid collisions with other bots.
+KEY_BUILDER = DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+"""Key builder shared by the FSM storage and the event isolation.
+
+It is stateless, so a single instance is reused across all dispatchers.
+"""
+
+
 class Config(pydantic_settings.BaseSettings, env_prefix="DP_"):
     fsm_strategy: FSMStrategy = FSMStrategy.USER_IN_CHAT
 
@@ -25,14 +33,11 @@ def create_dispatcher(config: Config, redis: Redis, **kwargs) -> aiogram.Dispatc
     :return: A new dispatcher instance.
     """
 
-    # Use bot id in key builder to avoid collisions with other bots.
-    key_builder = DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
-
-    storage = RedisStorage(redis=redis, key_builder=key_builder)
+    storage = RedisStorage(redis=redis, key_builder=KEY_BUILDER)
 
     # RedisEventIsolation guarantees that at any given moment only one update
     # from the user is being handled
-    event_isolation = RedisEventIsolation(redis=redis, key_builder=key_builder)
+    event_isolation = RedisEventIsolation(redis=redis, key_builder=KEY_BUILDER)
 
     dispatcher = aiogram.Dispatcher(
         storage=storage,
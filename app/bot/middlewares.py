@@ -10,6 +10,7 @@ from redis.asyncio import Redis
 
 from app.core import models
 from app.core.services import user as user_service
+from app.logging import is_enabled as is_logging_enabled
 from app.logging import logger
 
 if TYPE_CHECKING:
@@ -56,15 +57,19 @@ async def logging_middleware[T](
         context["chat_id"] = event_context.chat_id
 
     with logger.contextualize(**context):
-        if event_update:
-            logger.debug("Processing update: {!r}", event_update)
-        logger.debug("Event: {!r}", event)
-        logger.debug("Event context: {!r}", event_context)
-
-        fsm_state = await data["state"].get_state()
-        fsm_data = await data["state"].get_data()
-        logger.debug(f"FSM state: {fsm_state!r}")
-        logger.debug(f"FSM data: {fsm_data}")
+        # Reading the FSM state means extra round trips to the storage, so skip
+        # all of this when the debug messages would be dropped anyway.
+        if is_logging_enabled("DEBUG"):
+            if event_update:
+                logger.debug("Processing update: {!r}", event_update)
+            logger.debug("Event: {!r}", event)
+            logger.debug("Event context: {!r}", event_context)
+
+            state = data["state"]
+            fsm_state = await state.get_state()
+            fsm_data = await state.get_data()
+            logger.debug("FSM state: {!r}", fsm_state)
+            logger.debug("FSM data: {}", fsm_data)
 
         return await handler(event, data)
 
@@ -1,5 +1,6 @@
+import asyncio
 import itertools
-import operator
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import NamedTuple
 
@@ -8,6 +9,12 @@ import aiogram.types
 from aiogram.fsm.scene import Scene, on
 from loguru import logger
 
+MAX_MESSAGES_TO_DELETE_AT_ONCE = 100
+"""Telegram's limit on the number of messages in a single deleteMessages call."""
+
+_background_cleanups: set[asyncio.Task[None]] = set()
+"""Cleanups that are running in the background."""
+
 
 class MessageToDelete(NamedTuple):
     message_id: int
@@ -24,7 +31,8 @@ class AutoCleanupScene(Scene):
 
         logger.debug("Exiting via a message.")
 
-        await self.cleanup(bot)
+        # The messages don't have to be gone before the next scene is entered.
+        await self.cleanup(bot, wait=False)
 
         logger.info("Exited")
 
@@ -34,52 +42,120 @@ class AutoCleanupScene(Scene):
         :param message: A message that should be cleaned up latter.
         """
 
-        messages_to_delete: set[MessageToDelete] = await self._get_messages_to_delete()
-        messages_to_delete.add(MessageToDelete(message.message_id, message.chat.id))
+        # Duplicates are dropped only when the messages are popped, so this is a
+        # plain append.
+        messages_to_delete = await self._get_messages_to_delete()
+        messages_to_delete.append(MessageToDelete(message.message_id, message.chat.id))
         await self._set_messages_to_delete(messages_to_delete)
         logger.debug(
-            f"Message message_id={message.message_id} chat_id={message.chat.id} "
-            "registered for cleanup"
+            "Message message_id={} chat_id={} registered for cleanup",
+            message.message_id,
+            message.chat.id,
         )
 
-    async def cleanup(self, bot: aiogram.Bot) -> None:
+    async def cleanup(self, bot: aiogram.Bot, *, wait: bool = True) -> None:
         """Delete messages registered for cleanup
 
         :param bot: A bot instance that will be used to delete messages.
+        :param wait: Optional. If ``False``, the messages are forgotten right away,
+            but deleted in the background. Default is ``True``.
         """
         logger.debug("Cleaning up messages")
 
-        messages_to_delete = await self._get_messages_to_delete()
+        messages_to_delete = await self._pop_messages_to_delete()
 
-        # Group messages by chat_id to delete them in bulk
-        chat_id_getter = operator.itemgetter(1)
-        messages_to_delete = sorted(messages_to_delete, key=chat_id_getter)
-        for chat_id, messages in itertools.groupby(messages_to_delete, chat_id_getter):
-            messages = [message_id for message_id, _ in messages]
+        if wait:
+            await _delete_messages(bot, messages_to_delete)
+            return
 
-            logger.debug(f"Deleting messages chat_id={chat_id} messages={messages}")
-            try:
-                await bot.delete_messages(chat_id=chat_id, message_ids=messages)
-            except aiogram.exceptions.TelegramBadRequest as e:
-                logger.warning(
-                    f"Failed to clean up messages in chat id={chat_id}. Reason: {e}"
-                )
+        # Keep a strong reference, as the event loop only keeps weak ones.
+        task = asyncio.create_task(
+            _delete_messages_in_background(bot, messages_to_delete)
+        )
+        _background_cleanups.add(task)
+        task.add_done_callback(_background_cleanups.discard)
 
+    async def _pop_messages_to_delete(self) -> list[MessageToDelete]:
+        """Load messages to delete without duplicates and forget about them."""
+
+        messages_to_delete = await self._get_messages_to_delete()
         await self._set_messages_to_delete([])
 
-        logger.info("Cleaned up messages")
+        # dict.fromkeys() drops duplicates, preserving the order.
+        return list(dict.fromkeys(messages_to_delete))
 
-    async def _get_messages_to_delete(self) -> set[MessageToDelete]:
+    async def _get_messages_to_delete(self) -> list[MessageToDelete]:
         """Load and deserialize messages to delete from the FSM context."""
 
         messages_to_delete = await self.wizard.get_value("messages_to_delete", [])
-        return {
+        return [
             MessageToDelete(message_id, chat_id)
             for message_id, chat_id in messages_to_delete
-        }
+        ]
 
     async def _set_messages_to_delete(
         self, messages_to_delete: Iterable[MessageToDelete]
     ) -> None:
         """Serialize and save messages to delete to the FSM context."""
         await self.wizard.update_data(messages_to_delete=list(messages_to_delete))
+
+
+async def _delete_messages(
+    bot: aiogram.Bot, messages_to_delete: Iterable[MessageToDelete]
+) -> None:
+    """Delete messages in as few requests as possible.
+
+    :param bot: A bot instance that will be used to delete messages.
+    :param messages_to_delete: Messages to delete.
+    """
+
+    # Group messages by chat_id to delete them in bulk
+    messages_by_chat_id: defaultdict[int, list[int]] = defaultdict(list)
+    for message_id, chat_id in messages_to_delete:
+        messages_by_chat_id[chat_id].append(message_id)
+
+    # Telegram doesn't accept more than MAX_MESSAGES_TO_DELETE_AT_ONCE messages
+    # per call, so larger groups are split into chunks.
+    chunks: list[tuple[int, list[int]]] = []
+    for chat_id, messages in messages_by_chat_id.items():
+        for chunk in itertools.batched(messages, MAX_MESSAGES_TO_DELETE_AT_ONCE):
+            chunks.append((chat_id, list(chunk)))
+
+    # Chunks are independent, so there is no need to wait for one before
+    # deleting another.
+    for chat_id, messages in chunks:
+        logger.debug("Deleting messages chat_id={} messages={}", chat_id, messages)
+    results = await asyncio.gather(
+        *(
+            bot.delete_messages(chat_id=chat_id, message_ids=messages)
+            for chat_id, messages in chunks
+        ),
+        return_exceptions=True,
+    )
+    for (chat_id, _), result in zip(chunks, results, strict=True):
+        if isinstance(result, aiogram.exceptions.TelegramBadRequest):
+            logger.warning(
+                "Failed to clean up messages in chat id={}. Reason: {}",
+                chat_id,
+                result,
+            )
+        elif isinstance(result, BaseException):
+            raise result
+
+    logger.info("Cleaned up messages")
+
+
+async def _delete_messages_in_background(
+    bot: aiogram.Bot, messages_to_delete: Iterable[MessageToDelete]
+) -> None:
+    """Delete messages, logging errors instead of raising them, as there is
+    nobody to handle them.
+
+    :param bot: A bot instance that will be used to delete messages.
+    :param messages_to_delete: Messages to delete.
+    """
+
+    try:
+        await _delete_messages(bot, messages_to_delete)
+    except Exception:
+        logger.exception("Failed to clean up messages")
@@ -5,6 +5,12 @@ from loguru import logger
 
 from app.bot import constants
 
+BACK_BUTTON = aiogram.types.InlineKeyboardButton(
+    text=constants.BACK_BUTTON_TEXT,
+    callback_data=constants.BACK_BUTTON_CD,
+)
+"""The back button shared by the keyboards of all scenes."""
+
 
 class HandleBackButtonClickMixin:
     """A mixin that provides the handle_back_button_click handler that triggers on
@@ -22,13 +28,10 @@ class HandleBackButtonClickMixin:
         await self.wizard.back()
 
         new_state = await self.wizard.state.get_state()
-        logger.info(f"Handled a back button click. Went back to state: {new_state!r}.")
+        logger.info("Handled a back button click. Went back to state: {!r}.", new_state)
 
     @staticmethod
     def get_back_button() -> aiogram.types.InlineKeyboardButton:
-        """Create a back button."""
+        """Get a back button."""
 
-        return aiogram.types.InlineKeyboardButton(
-            text=constants.BACK_BUTTON_TEXT,
-            callback_data=constants.BACK_BUTTON_CD,
-        )
+        return BACK_BUTTON
@@ -1,10 +1,10 @@
-import operator
+import functools
+import itertools
 
 import aiogram
 from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.scene import on
 from aiogram.utils import formatting as fmt
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,12 @@ from ..utils import get_checkbox
 from ._autocleanupscene import AutoCleanupScene
 from ._mixins import HandleBackButtonClickMixin
 
+MESSAGE_TEXT_KWARGS = fmt.Bold("Genres:").as_kwargs()
+"""Text and entities of the genre selector message."""
+
+GENRE_BUTTONS_PER_ROW = 3
+"""How many genre buttons are shown in a single keyboard row."""
+
 
 class GenreButtonCD(CallbackData, prefix="genre"):
     genre_id: int
@@ -25,6 +31,48 @@ class GenreCombinatorButtonCD(CallbackData, prefix="genre_combinator"):
     require_all: bool
 
 
+GENRE_COMBINATOR_BUTTONS = {
+    require_all: aiogram.types.InlineKeyboardButton(
+        text=f"Require {'all' if require_all else 'any'} selected",
+        callback_data=GenreCombinatorButtonCD(require_all=not require_all).pack(),
+    )
+    for require_all in (True, False)
+}
+"""Genre combinator buttons by the user's current ``requires_all_selected_genres``."""
+
+
+# Every render packs a button per genre, and there are only a few dozen genres.
+@functools.lru_cache(maxsize=256)
+def pack_genre_button_cd(genre_id: int, selected: bool) -> str:
+    """Pack the callback data of a genre button, reusing previously packed values.
+
+    :param genre_id: The ID of the genre.
+    :param selected: Whether the click selects the genre.
+    :return: Packed callback data.
+    """
+
+    return GenreButtonCD(genre_id=genre_id, selected=selected).pack()
+
+
+# Buttons are immutable, so the same ones are reused across renders.
+@functools.lru_cache(maxsize=256)
+def get_genre_button(
+    genre_id: int, name: str, selected: bool
+) -> aiogram.types.InlineKeyboardButton:
+    """Get a button that toggles the genre.
+
+    :param genre_id: The ID of the genre.
+    :param name: The name of the genre.
+    :param selected: Whether the genre is currently selected.
+    :return: A button showing the genre's state, clicking which flips it.
+    """
+
+    return aiogram.types.InlineKeyboardButton(
+        text=f"{get_checkbox(selected)} {name.capitalize()}",
+        callback_data=pack_genre_button_cd(genre_id, not selected),
+    )
+
+
 class GenreSelectorScene(AutoCleanupScene, HandleBackButtonClickMixin, state="genre"):
     @on.callback_query.enter()
     async def enter_via_callback_query(
@@ -36,7 +84,7 @@ class GenreSelectorScene(AutoCleanupScene, HandleBackButtonClickMixin, state="ge
         logger.debug("Entering the genre selector via a callback query.")
 
         await callback_query.message.edit_text(
-            **self.construct_message_text().as_kwargs(),
+            **MESSAGE_TEXT_KWARGS,
             reply_markup=await self.construct_message_keyboard(user, session),
         )
 
@@ -53,22 +101,36 @@ class GenreSelectorScene(AutoCleanupScene, HandleBackButtonClickMixin, state="ge
         """Handle a user click on a genre button."""
 
         logger.debug(
-            f"User selected: genre_id={callback_data.genre_id!r}, "
-            f"selected={callback_data.selected!r}"
+            "User selected: genre_id={!r}, selected={!r}",
+            callback_data.genre_id,
+            callback_data.selected,
+        )
+
+        selected_genres = await user.awaitable_attrs.selected_genres
+        is_selected = any(
+            genre.id == callback_data.genre_id for genre in selected_genres
         )
+        if is_selected == callback_data.selected:
+            logger.info("Same value. No update needed")
+            await callback_query.answer()
+            return
 
-        genre = await genre_service.get_by_id(session, callback_data.genre_id)
-        if callback_data.selected:
-            await user.select_genre(genre)
-        else:
-            await user.deselect_genre(genre)
+        await genre_service.set_selection(
+            session, user.id, callback_data.genre_id, callback_data.selected
+        )
         await session.commit()
+        # The selection was changed directly in the database.
+        session.expire(user, ["selected_genres"])
         logger.info(
-            f"Genre id={callback_data.genre_id!r}: selected={callback_data.selected!r}."
+            "Genre id={!r}: selected={!r}.",
+            callback_data.genre_id,
+            callback_data.selected,
         )
 
-        # Update the message
-        await self.wizard.retake(_with_history=False)
+        # Only the keyboard changes, so there is no need to re-enter the scene.
+        await callback_query.message.edit_reply_markup(
+            reply_markup=await self.construct_message_keyboard(user, session)
+        )
 
     @on.callback_query(GenreCombinatorButtonCD.filter())
     async def handle_genre_combinator_button_click(
@@ -86,18 +148,21 @@ class GenreSelectorScene(AutoCleanupScene, HandleBackButtonClickMixin, state="ge
         :param callback_data: Parsed callback data.
         """
 
-        logger.debug(f"User selected: require_all={callback_data.require_all!r}.")
+        logger.debug("User selected: require_all={!r}.", callback_data.require_all)
+
+        if user.requires_all_selected_genres == callback_data.require_all:
+            logger.info("Same value. No update needed")
+            await callback_query.answer()
+            return
 
         user.requires_all_selected_genres = callback_data.require_all
         await session.commit()
-        logger.info(f"Genre combinator: require_all={callback_data.require_all!r}.")
-
-        # Update the message
-        await self.wizard.retake(_with_history=False)
+        logger.info("Genre combinator: require_all={!r}.", callback_data.require_all)
 
-    @staticmethod
-    def construct_message_text() -> fmt.Text:
-        return fmt.Bold("Genres:")
+        # Only the keyboard changes, so there is no need to re-enter the scene.
+        await callback_query.message.edit_reply_markup(
+            reply_markup=await self.construct_message_keyboard(user, session)
+        )
 
     async def construct_message_keyboard(
         self, user: models.User, session: AsyncSession
@@ -108,34 +173,26 @@ class GenreSelectorScene(AutoCleanupScene, HandleBackButtonClickMixin, state="ge
         :param session: An SQLAlchemy session.
         """
 
-        all_genres = await genre_service.list_all(session)
-        all_genres.sort(key=operator.attrgetter("name"))
-        selected_genres = await user.awaitable_attrs.selected_genres
-
-        genre_button_builder = InlineKeyboardBuilder()
-        for genre in all_genres:
-            selected = genre in selected_genres
-            checkbox = get_checkbox(selected)
-            name = genre.name.capitalize()
-            text = f"{checkbox} {name}"
-
-            genre_button_builder.button(
-                text=text,
-                callback_data=GenreButtonCD(genre_id=genre.id, selected=not selected),
-            )
-
-        genre_combinator_builder = InlineKeyboardBuilder().button(
-            text=f"Require {'all' if user.requires_all_selected_genres else 'any'} "
-            f"selected",
-            callback_data=GenreCombinatorButtonCD(
-                require_all=not user.requires_all_selected_genres
-            ),
+        # These are awaited one by one, because an AsyncSession can't run queries
+        # concurrently. Usually neither of them hits the database anyway: the
+        # genres are cached, and the selection is loaded together with the user.
+        all_genres = await genre_service.list_all_sorted_cached(session)
+        # Compare ids, as the cached genres don't come from this session.
+        selected_genre_ids = frozenset(
+            genre.id for genre in await user.awaitable_attrs.selected_genres
         )
 
-        return (
-            InlineKeyboardBuilder()
-            .attach(genre_button_builder.adjust(3))
-            .attach(genre_combinator_builder)
-            .row(self.get_back_button())
-            .as_markup()
+        # The markup is assembled directly, without builders, because it's rebuilt
+        # on every click.
+        genre_buttons = [
+            get_genre_button(genre.id, genre.name, genre.id in selected_genre_ids)
+            for genre in all_genres
+        ]
+
+        return aiogram.types.InlineKeyboardMarkup(
+            inline_keyboard=[
+                *map(list, itertools.batched(genre_buttons, GENRE_BUTTONS_PER_ROW)),
+                [GENRE_COMBINATOR_BUTTONS[user.requires_all_selected_genres]],
+                [self.get_back_button()],
+            ]
         )
@@ -1,3 +1,5 @@
+import functools
+
 import aiogram
 from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.scene import on
@@ -12,6 +14,12 @@ from ..utils import get_checkbox
 from ._autocleanupscene import AutoCleanupScene
 from ._mixins import HandleBackButtonClickMixin
 
+MESSAGE_TEXT_KWARGS = fmt.Bold("Minimum Rating:").as_kwargs()
+"""Text and entities of the minimum rating selector message."""
+
+POSSIBLE_RATINGS = (9, 9.5, 8, 8.5, 7, 7.5, 6, 6.5, 5, 5.5)
+"""Ratings offered to the user, besides any (0), in the order of the buttons."""
+
 
 class MovieRatingButtonCD(CallbackData, prefix="movie_rating"):
     rating: float
@@ -37,7 +45,7 @@ class MinimumMovieRatingSelectorScene(
         logger.debug("Entering the minimum movie rating selector via a callback query.")
 
         await callback_query.message.edit_text(
-            **self.create_message_text().as_kwargs(),
+            **MESSAGE_TEXT_KWARGS,
             reply_markup=self.create_message_keyboard(user),
         )
 
@@ -69,60 +77,64 @@ class MinimumMovieRatingSelectorScene(
 
         user.minimum_movie_rating = callback_data.rating
         await session.commit()
-        logger.info(f"Set {user.minimum_movie_rating=}")
+        logger.info("Set user.minimum_movie_rating={!r}", user.minimum_movie_rating)
 
-        await self.wizard.retake(_with_history=False)
-
-    @staticmethod
-    def create_message_text() -> fmt.Text:
-        return fmt.Bold("Minimum Rating:")
+        # Only the keyboard changes, so there is no need to re-enter the scene.
+        await callback_query.message.edit_reply_markup(
+            reply_markup=self.create_message_keyboard(user)
+        )
 
     def create_message_keyboard(
         self,
         user: models.User,
     ) -> aiogram.types.InlineKeyboardMarkup:
-        possible_ratings = [9, 9.5, 8, 8.5, 7, 7.5, 6, 6.5, 5, 5.5]
-        rating_buttons_builder = InlineKeyboardBuilder()
-        any_option_selected = False
+        logger.debug("user.minimum_movie_rating={!r}", user.minimum_movie_rating)
+
+        if (
+            user.minimum_movie_rating not in POSSIBLE_RATINGS
+            and user.minimum_movie_rating != 0
+        ):
+            logger.warning(
+                "No option selected. minimum_movie_rating={}", user.minimum_movie_rating
+            )
 
-        logger.debug(f"{user.minimum_movie_rating=}")
+        return _build_message_keyboard(user.minimum_movie_rating)
 
-        for rating in possible_ratings:
-            selected = user.minimum_movie_rating == rating
-            checkbox = get_checkbox(selected)
-            text = f"{checkbox} {rating}"
 
-            if selected:
-                any_option_selected = True
+# The keyboard only depends on the selected rating, so it's built once per option.
+@functools.lru_cache(maxsize=len(POSSIBLE_RATINGS) + 1)
+def _build_message_keyboard(
+    selected_rating: float,
+) -> aiogram.types.InlineKeyboardMarkup:
+    rating_buttons_builder = InlineKeyboardBuilder()
 
-            rating_buttons_builder.button(
-                text=text,
-                callback_data=MovieRatingButtonCD(rating=rating),
-            )
+    for rating in POSSIBLE_RATINGS:
+        selected = selected_rating == rating
+        checkbox = get_checkbox(selected)
+        text = f"{checkbox} {rating}"
 
-        # Special case - any rating (min rating is 0)
-        selected = user.minimum_movie_rating == 0
         rating_buttons_builder.button(
-            text=f"{get_checkbox(selected)} Any",
-            callback_data=MovieRatingButtonCD(rating=0),
-        )
-        if selected:
-            any_option_selected = True
-
-        if not any_option_selected:
-            logger.warning(f"No option selected. {user.minimum_movie_votes=}")
-
-        # Expected shape:
-        # 9 9.5
-        # 8 8.5
-        # ...
-        # Any
-        button_shape = [2] * (len(possible_ratings) // 2) + [1]
-        rating_buttons_builder.adjust(*button_shape)
-
-        return (
-            InlineKeyboardBuilder()
-            .attach(rating_buttons_builder)
-            .row(self.get_back_button())
-            .as_markup()
+            text=text,
+            callback_data=MovieRatingButtonCD(rating=rating),
         )
+
+    # Special case - any rating (min rating is 0)
+    rating_buttons_builder.button(
+        text=f"{get_checkbox(selected_rating == 0)} Any",
+        callback_data=MovieRatingButtonCD(rating=0),
+    )
+
+    # Expected shape:
+    # 9 9.5
+    # 8 8.5
+    # ...
+    # Any
+    button_shape = [2] * (len(POSSIBLE_RATINGS) // 2) + [1]
+    rating_buttons_builder.adjust(*button_shape)
+
+    return (
+        InlineKeyboardBuilder()
+        .attach(rating_buttons_builder)
+        .row(HandleBackButtonClickMixin.get_back_button())
+        .as_markup()
+    )
@@ -1,3 +1,5 @@
+import functools
+
 import aiogram
 from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.scene import on
@@ -12,6 +14,12 @@ from ..utils import get_checkbox
 from ._autocleanupscene import AutoCleanupScene
 from ._mixins import HandleBackButtonClickMixin
 
+MESSAGE_TEXT_KWARGS = fmt.Bold("Minimum Votes:").as_kwargs()
+"""Text and entities of the minimum votes selector message."""
+
+POSSIBLE_VOTES = (1_000, 10_000, 50_000, 100_000, 200_000)
+"""Vote counts offered to the user, besides any (0), in the order of the buttons."""
+
 
 class MovieVotesButtonCD(CallbackData, prefix="movie_votes"):
     votes: int
@@ -37,7 +45,7 @@ class MinimumMovieVotesSelectorScene(
         logger.debug("Entering the minimum movie votes selector via a callback query.")
 
         await callback_query.message.edit_text(
-            **self.create_message_text().as_kwargs(),
+            **MESSAGE_TEXT_KWARGS,
             reply_markup=self.create_message_keyboard(user),
         )
 
@@ -69,54 +77,56 @@ class MinimumMovieVotesSelectorScene(
 
         user.minimum_movie_votes = callback_data.votes
         await session.commit()
-        logger.info(f"Set {user.minimum_movie_votes=}")
-
-        await self.wizard.retake(_with_history=False)
+        logger.info("Set user.minimum_movie_votes={!r}", user.minimum_movie_votes)
 
-    @staticmethod
-    def create_message_text() -> fmt.Text:
-        return fmt.Bold("Minimum Votes:")
+        # Only the keyboard changes, so there is no need to re-enter the scene.
+        await callback_query.message.edit_reply_markup(
+            reply_markup=self.create_message_keyboard(user)
+        )
 
     def create_message_keyboard(
         self,
         user: models.User,
     ) -> aiogram.types.InlineKeyboardMarkup:
-        possible_votes = [1_000, 10_000, 50_000, 100_000, 200_000]
-        votes_buttons_builder = InlineKeyboardBuilder()
-        any_option_selected = False
+        logger.debug("user.minimum_movie_votes={!r}", user.minimum_movie_votes)
+
+        if (
+            user.minimum_movie_votes not in POSSIBLE_VOTES
+            and user.minimum_movie_votes != 0
+        ):
+            logger.warning(
+                "No option selected. minimum_movie_votes={}", user.minimum_movie_votes
+            )
 
-        logger.debug(f"{user.minimum_movie_votes=}")
+        return _build_message_keyboard(user.minimum_movie_votes)
 
-        for votes in possible_votes:
-            selected = user.minimum_movie_votes == votes
-            checkbox = get_checkbox(selected)
-            text = f"{checkbox} {votes}"
 
-            if selected:
-                any_option_selected = True
+# The keyboard only depends on the selected votes, so it's built once per option.
+@functools.lru_cache(maxsize=len(POSSIBLE_VOTES) + 1)
+def _build_message_keyboard(selected_votes: int) -> aiogram.types.InlineKeyboardMarkup:
+    votes_buttons_builder = InlineKeyboardBuilder()
 
-            votes_buttons_builder.button(
-                text=text,
-                callback_data=MovieVotesButtonCD(votes=votes),
-            )
+    for votes in POSSIBLE_VOTES:
+        selected = selected_votes == votes
+        checkbox = get_checkbox(selected)
+        text = f"{checkbox} {votes}"
 
-        # Special case - any votes (min votes is 0)
-        selected = user.minimum_movie_votes == 0
         votes_buttons_builder.button(
-            text=f"{get_checkbox(selected)} Any",
-            callback_data=MovieVotesButtonCD(votes=0),
+            text=text,
+            callback_data=MovieVotesButtonCD(votes=votes),
         )
-        if selected:
-            any_option_selected = True
 
-        if not any_option_selected:
-            logger.warning(f"No option selected. {user.minimum_movie_votes=}")
+    # Special case - any votes (min votes is 0)
+    votes_buttons_builder.button(
+        text=f"{get_checkbox(selected_votes == 0)} Any",
+        callback_data=MovieVotesButtonCD(votes=0),
+    )
 
-        votes_buttons_builder.adjust(len(possible_votes), 1)
+    votes_buttons_builder.adjust(len(POSSIBLE_VOTES), 1)
 
-        return (
-            InlineKeyboardBuilder()
-            .attach(votes_buttons_builder)
-            .row(self.get_back_button())
-            .as_markup()
-        )
+    return (
+        InlineKeyboardBuilder()
+        .attach(votes_buttons_builder)
+        .row(HandleBackButtonClickMixin.get_back_button())
+        .as_markup()
+    )
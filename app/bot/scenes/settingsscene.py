@@ -1,6 +1,10 @@
+import functools
+import operator
+from typing import Any
+
 import aiogram.filters
 from aiogram import F
-from aiogram.fsm.scene import ScenesManager, on
+from aiogram.fsm.scene import Scene, ScenesManager, on
 from aiogram.utils import formatting as fmt
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
@@ -15,6 +19,63 @@ from app.bot.scenes.titletypeselectorscene import TitleTypeSelectorScene
 from app.core import models
 from app.logging import logger
 
+get_name = operator.attrgetter("name")
+"""Get the name of a title type or a genre."""
+
+SETTINGS_KEYBOARD = (
+    InlineKeyboardBuilder()
+    .button(text="Title Types", callback_data="title_types")
+    .button(text="Genres", callback_data="genres")
+    .button(text="Minimum Rating", callback_data="minimum_rating")
+    .button(text="Minimum Votes", callback_data="minimum_votes")
+    .button(text="❌ Close", callback_data="close")
+    .adjust(2, 2, 1)
+    .as_markup()
+)
+"""The keyboard of the settings scene. It never changes, so it's built once."""
+
+SETTINGS_SELECTOR_SCENES: dict[str, type[Scene]] = {
+    "title_types": TitleTypeSelectorScene,
+    "genres": GenreSelectorScene,
+    "minimum_rating": MinimumMovieRatingSelectorScene,
+    "minimum_votes": MinimumMovieVotesSelectorScene,
+}
+"""Selector scenes opened from the settings, by the callback data of their buttons."""
+
+
+@functools.lru_cache(maxsize=1024)
+def render_settings_text(
+    title_types: str,
+    genres: str,
+    requires_all_selected_genres: bool,
+    minimum_movie_rating: float,
+    minimum_movie_votes: int,
+) -> dict[str, Any]:
+    """Render the settings text, reusing the result for the same settings.
+
+    Many users share the same settings, so the formatting tree is only built and
+    rendered for the first one of them. The result must not be modified.
+
+    :param title_types: Comma-separated names of the selected title types.
+    :param genres: Comma-separated names of the selected genres.
+    :param requires_all_selected_genres: Whether all selected genres are required.
+    :param minimum_movie_rating: The minimum movie rating.
+    :param minimum_movie_votes: The minimum number of votes.
+    :return: Text and entities of the settings message.
+    """
+
+    genres += f" ({'all' if requires_all_selected_genres else 'any'})"
+    return fmt.as_section(
+        fmt.Bold("⚙ ", fmt.Underline("Settings")),
+        "\n",
+        fmt.as_list(
+            fmt.as_key_value("Title Types", title_types),
+            fmt.as_key_value("Genres", genres),
+            fmt.as_key_value("Minimum Rating", minimum_movie_rating or "any"),
+            fmt.as_key_value("Minimum Votes", minimum_movie_votes or "any"),
+        ),
+    ).as_kwargs()
+
 
 class SettingsScene(AutoCleanupScene, state="settings"):
     """This is the scene with the main page of a user's settings."""
@@ -30,7 +91,7 @@ class SettingsScene(AutoCleanupScene, state="settings"):
         await self.register_for_cleanup(message)
 
         sent_message = await message.answer(
-            **(await self.construct_settings_text(user)).as_kwargs(),
+            **await self.construct_settings_text_kwargs(user),
             reply_markup=self.construct_settings_keyboard(),
         )
         await self.register_for_cleanup(sent_message)
@@ -46,7 +107,7 @@ class SettingsScene(AutoCleanupScene, state="settings"):
         logger.debug("Entering settings via a callback query.")
 
         await callback_query.message.edit_text(
-            **(await self.construct_settings_text(user)).as_kwargs(),
+            **await self.construct_settings_text_kwargs(user),
             reply_markup=self.construct_settings_keyboard(),
         )
 
@@ -61,64 +122,27 @@ class SettingsScene(AutoCleanupScene, state="settings"):
 
         logger.debug("Exiting settings via a message.")
 
-        await self.cleanup(bot)
+        # The messages don't have to be gone before the next scene is entered.
+        await self.cleanup(bot, wait=False)
 
         logger.info("Exited settings")
 
-    @on.callback_query(F.data == "title_types")
-    async def handle_title_types_button_click(
-        self, callback_query: aiogram.types.CallbackQuery
-    ) -> None:
-        """This method is called when the user clicks the "Title Types"
-        button in the settings."""
-
-        logger.debug("Handling title types button click.")
-
-        await self.wizard.goto(TitleTypeSelectorScene)
-
-        logger.info("Handled title types button click. Going to title type selector.")
-
-    @on.callback_query(F.data == "genres")
-    async def handle_genres_button_click(
-        self, callback_query: aiogram.types.CallbackQuery
-    ) -> None:
-        """This method is called when the user clicks the "Genres"
-        button in the settings."""
-
-        logger.debug("Handling genres button click.")
-
-        await self.wizard.goto(GenreSelectorScene)
-
-        logger.info("Handled genres button click. Going to the genre selector.")
-
-    @on.callback_query(F.data == "minimum_rating")
-    async def handle_minimum_rating_button_click(
-        self, callback_query: aiogram.types.CallbackQuery
-    ) -> None:
-        """This method is called when the user clicks the "Minimum Rating"
-        button in the settings."""
-
-        logger.debug("Handling minimum rating button click.")
-
-        await self.wizard.goto(MinimumMovieRatingSelectorScene)
-
-        logger.info(
-            "Handled minimum rating button click. Going to the minimum rating selector."
-        )
-
-    @on.callback_query(F.data == "minimum_votes")
-    async def handle_minimum_votes_button_click(
+    @on.callback_query(F.data.in_(SETTINGS_SELECTOR_SCENES))
+    async def handle_selector_button_click(
         self, callback_query: aiogram.types.CallbackQuery
     ) -> None:
-        """This method is called when the user clicks the "Minimum Votes"
-        button in the settings."""
+        """This method is called when the user clicks one of the buttons that open
+        a selector for a setting."""
 
-        logger.debug("Handling minimum votes button click.")
+        logger.debug("Handling {} button click.", callback_query.data)
 
-        await self.wizard.goto(MinimumMovieVotesSelectorScene)
+        selector_scene = SETTINGS_SELECTOR_SCENES[callback_query.data]
+        await self.wizard.goto(selector_scene)
 
         logger.info(
-            "Handled minimum votes button click. Going to the minimum votes selector."
+            "Handled {} button click. Going to {}.",
+            callback_query.data,
+            selector_scene.__name__,
         )
 
     @on.callback_query(F.data == "close")
@@ -132,34 +156,29 @@ class SettingsScene(AutoCleanupScene, state="settings"):
         # We want to delete the message even if we got here via a callback query.
         await self.register_for_cleanup(callback_query.message)
 
-        await self.cleanup(callback_query.bot)
-        logger.debug("Cleaned up settings")
+        # The suggestion can be sent while the settings are being deleted.
+        await self.cleanup(callback_query.bot, wait=False)
+        logger.debug("Scheduled the settings cleanup")
 
         await scenes.enter(SuggestionScene)
         logger.info("Went to suggestions")
 
     @staticmethod
-    async def construct_settings_text(user: models.User) -> fmt.Text:
+    async def construct_settings_text_kwargs(user: models.User) -> dict[str, Any]:
         """Construct the text to be shown to the user in this scene.
 
         :param user: The user object that contains the settings.
-        :return: The text to be shown to the user.
+        :return: Text and entities to be shown to the user.
         """
 
         selected_title_types = await user.awaitable_attrs.selected_title_types
-        selected_title_types = ", ".join(sorted(tt.name for tt in selected_title_types))
         selected_genres = await user.awaitable_attrs.selected_genres
-        selected_genres = ", ".join(sorted(genre.name for genre in selected_genres))
-        selected_genres += f" ({'all' if user.requires_all_selected_genres else 'any'})"
-        return fmt.as_section(
-            fmt.Bold("⚙ ", fmt.Underline("Settings")),
-            "\n",
-            fmt.as_list(
-                fmt.as_key_value("Title Types", selected_title_types),
-                fmt.as_key_value("Genres", selected_genres),
-                fmt.as_key_value("Minimum Rating", user.minimum_movie_rating or "any"),
-                fmt.as_key_value("Minimum Votes", user.minimum_movie_votes or "any"),
-            ),
+        return render_settings_text(
+            ", ".join(sorted(map(get_name, selected_title_types))),
+            ", ".join(sorted(map(get_name, selected_genres))),
+            user.requires_all_selected_genres,
+            user.minimum_movie_rating,
+            user.minimum_movie_votes,
         )
 
     @staticmethod
@@ -169,13 +188,4 @@ class SettingsScene(AutoCleanupScene, state="settings"):
         :return: The keyboard to be shown to the user.
         """
 
-        return (
-            InlineKeyboardBuilder()
-            .button(text="Title Types", callback_data="title_types")
-            .button(text="Genres", callback_data="genres")
-            .button(text="Minimum Rating", callback_data="minimum_rating")
-            .button(text="Minimum Votes", callback_data="minimum_votes")
-            .button(text="❌ Close", callback_data="close")
-            .adjust(2, 2, 1)
-            .as_markup()
-        )
+        return SETTINGS_KEYBOARD
@@ -1,3 +1,6 @@
+import asyncio
+import operator
+
 import aiogram
 import aiogram.exceptions
 import aiogram.utils.formatting as fmt
@@ -12,6 +15,18 @@ from app.core.services import suggestions as suggestion_service
 
 SETTINGS_SCENE = "settings"
 
+SUGGESTION_KEYBOARD = (
+    InlineKeyboardBuilder()
+    .button(text="🔄 Next", callback_data="new_suggestion")
+    .button(text="⚙ Settings", callback_data="settings")
+    .adjust(1)
+    .as_markup()
+)
+"""Action buttons attached to every suggestion."""
+
+_background_deletions: set[asyncio.Task[None]] = set()
+"""Deletions of incoming messages that are running in the background."""
+
 
 class SuggestionScene(Scene, state="suggestions"):
     """A scene where all suggestions are displayed.
@@ -34,10 +49,12 @@ class SuggestionScene(Scene, state="suggestions"):
 
         logger.debug("Entering the suggestion scene via a message.")
 
-        try:
-            await message.delete()
-        except aiogram.exceptions.TelegramAPIError as e:
-            logger.warning(f"Failed to delete an incoming message. Reason: {e}")
+        # The user doesn't need to wait for their message to be gone, so it's deleted
+        # while the suggestion is being prepared. Keep a strong reference to the task,
+        # as the event loop only keeps weak ones.
+        task = asyncio.create_task(_delete_message(message))
+        _background_deletions.add(task)
+        task.add_done_callback(_background_deletions.discard)
 
         await self.send_suggestion(message.bot, session, user)
 
@@ -86,14 +103,17 @@ class SuggestionScene(Scene, state="suggestions"):
         await suggestion_service.skip_suggested_title(
             session, user, last_suggested_title_id
         )
+
+        # The keyboard is only removed once the skip is saved, so a failed commit
+        # leaves the old suggestion usable.
         await session.commit()
-        logger.info(f"Skipped the old suggestion with id={last_suggested_title_id}")
+        logger.info("Skipped the old suggestion with id={}", last_suggested_title_id)
 
         # Make the old suggestion non-interactive
         try:
             await callback_query.message.edit_reply_markup()
         except aiogram.exceptions.TelegramAPIError as e:
-            logger.warning(f"Failed to edit the old suggestion's message. Reason: {e}")
+            logger.warning("Failed to edit the old suggestion's message. Reason: {}", e)
         else:
             logger.debug("Removed keyboard of the old suggestion's message")
 
@@ -126,7 +146,7 @@ class SuggestionScene(Scene, state="suggestions"):
         logger.debug("Sending a suggestion")
 
         if suggestion := await suggestion_service.suggest_title(session, user):
-            logger.debug(f"{suggestion=}")
+            logger.debug("suggestion={!r}", suggestion)
             text = fmt.as_list(
                 fmt.Bold(
                     fmt.Underline(suggestion.title), f" ({suggestion.start_year})"
@@ -137,8 +157,10 @@ class SuggestionScene(Scene, state="suggestions"):
                     "Genres",
                     ", ".join(
                         sorted(
-                            genre.name
-                            for genre in await suggestion.awaitable_attrs.genres
+                            map(
+                                operator.attrgetter("name"),
+                                await suggestion.awaitable_attrs.genres,
+                            )
                         )
                     ),
                 ),
@@ -153,18 +175,23 @@ class SuggestionScene(Scene, state="suggestions"):
                 "No new suggestions found. "
                 "Try updating your filter settings or try again later."
             )
-        reply_markup = (
-            InlineKeyboardBuilder()
-            .button(text="🔄 Next", callback_data="new_suggestion")
-            .button(text="⚙ Settings", callback_data="settings")
-            .adjust(1)
-            .as_markup()
-        )
 
         await bot.send_message(
-            chat_id=user.id, **text.as_kwargs(), reply_markup=reply_markup
+            chat_id=user.id, **text.as_kwargs(), reply_markup=SUGGESTION_KEYBOARD
         )
         if suggestion:
-            logger.info(f"Suggested a title with id={suggestion.id}.")
+            logger.info("Suggested a title with id={}.", suggestion.id)
         else:
             logger.info("Notified that no suggestion is available.")
+
+
+async def _delete_message(message: aiogram.types.Message) -> None:
+    """Delete a message, only logging a warning if it can't be deleted.
+
+    :param message: A message to delete.
+    """
+
+    try:
+        await message.delete()
+    except aiogram.exceptions.TelegramAPIError as e:
+        logger.warning("Failed to delete an incoming message. Reason: {}", e)
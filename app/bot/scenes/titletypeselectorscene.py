@@ -1,9 +1,10 @@
+import functools
+
 import aiogram
 import sqlalchemy.ext.asyncio as sa_async
 from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.scene import on
 from aiogram.utils import formatting as fmt
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from loguru import logger
 
 from app.bot.scenes._autocleanupscene import AutoCleanupScene
@@ -12,12 +13,28 @@ from app.bot.utils import get_checkbox
 from app.core import models
 from app.core.services import title_type as title_type_service
 
+MESSAGE_TEXT_KWARGS = fmt.Bold("Title Types:").as_kwargs()
+"""Text and entities of the title type selector message."""
+
 
 class TitleTypeButton(CallbackData, prefix="title_type"):
     title_type_id: int
     selected: bool
 
 
+@functools.lru_cache(maxsize=32)
+def pack_title_type_button(title_type_id: int, selected: bool) -> str:
+    """Pack the callback data of a title type button, reusing previously packed
+    values.
+
+    :param title_type_id: The ID of the title type.
+    :param selected: Whether the click selects the title type.
+    :return: Packed callback data.
+    """
+
+    return TitleTypeButton(title_type_id=title_type_id, selected=selected).pack()
+
+
 class TitleTypeSelectorScene(
     AutoCleanupScene, HandleBackButtonClickMixin, state="title_type_selector"
 ):
@@ -31,7 +48,7 @@ class TitleTypeSelectorScene(
         logger.debug("Entering the title type selector via a callback query.")
 
         await callback_query.message.edit_text(
-            **self.construct_message_text().as_kwargs(),
+            **MESSAGE_TEXT_KWARGS,
             reply_markup=await self.construct_message_keyboard(user, session),
         )
 
@@ -48,34 +65,37 @@ class TitleTypeSelectorScene(
         """Handle a user click on a title type button."""
 
         logger.debug(
-            f"User selected: title_type_id={callback_data.title_type_id!r}, "
-            f"selected={callback_data.selected!r}"
+            "User selected: title_type_id={!r}, selected={!r}",
+            callback_data.title_type_id,
+            callback_data.selected,
+        )
+
+        selected_title_types = await user.awaitable_attrs.selected_title_types
+        is_selected = any(
+            title_type.id == callback_data.title_type_id
+            for title_type in selected_title_types
         )
+        if is_selected == callback_data.selected:
+            logger.info("Same value. No update needed")
+            await callback_query.answer()
+            return
 
-        title_type = await title_type_service.get_by_id(
-            session, callback_data.title_type_id
+        await title_type_service.set_selection(
+            session, user.id, callback_data.title_type_id, callback_data.selected
         )
-        if callback_data.selected:
-            await user.select_title_type(title_type)
-        else:
-            await user.deselect_title_type(title_type)
         await session.commit()
+        # The selection was changed directly in the database.
+        session.expire(user, ["selected_title_types"])
         logger.info(
-            f"Title type id={callback_data.title_type_id!r}: "
-            f"selected={callback_data.selected!r}."
+            "Title type id={!r}: selected={!r}.",
+            callback_data.title_type_id,
+            callback_data.selected,
         )
 
-        # Update the message
-        await self.wizard.retake(_with_history=False)
-
-    @staticmethod
-    def construct_message_text() -> fmt.Text:
-        """Construct the text to be shown to the user in this scene.
-
-        :return: The text to be shown to the user.
-        """
-
-        return fmt.Bold("Title Types:")
+        # Only the keyboard changes, so there is no need to re-enter the scene.
+        await callback_query.message.edit_reply_markup(
+            reply_markup=await self.construct_message_keyboard(user, session)
+        )
 
     async def construct_message_keyboard(
         self, user: models.User, session: sa_async.AsyncSession
@@ -87,25 +107,26 @@ class TitleTypeSelectorScene(
         :return: The keyboard to be shown to the user.
         """
 
-        all_title_types = await title_type_service.list_all(session)
-        selected_title_types: set[
-            models.TitleType
-        ] = await user.awaitable_attrs.selected_title_types
+        all_title_types = await title_type_service.list_all_cached(session)
+        selected_title_type_ids = frozenset(
+            title_type.id
+            for title_type in await user.awaitable_attrs.selected_title_types
+        )
 
         # Construct a button for each title type and put them in a single row.
         # This should be okay because there won't be many.
         row: list[aiogram.types.InlineKeyboardButton] = []
         for title_type in all_title_types:
-            selected = title_type in selected_title_types
+            selected = title_type.id in selected_title_type_ids
             checkbox = get_checkbox(selected)
             name = title_type.name.capitalize()
 
             button = aiogram.types.InlineKeyboardButton(
                 text=f"{checkbox} {name}",
-                callback_data=TitleTypeButton(
-                    title_type_id=title_type.id, selected=not selected
-                ).pack(),
+                callback_data=pack_title_type_button(title_type.id, not selected),
             )
             row.append(button)
 
-        return InlineKeyboardBuilder().row(*row).row(self.get_back_button()).as_markup()
+        return aiogram.types.InlineKeyboardMarkup(
+            inline_keyboard=[row, [self.get_back_button()]]
+        )
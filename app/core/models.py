@@ -8,7 +8,6 @@ import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
 import sqlalchemy.orm as orm
 
-from app.core import constants
 from app.utils import utcnow
 
 
@@ -16,6 +15,9 @@ class _AwareDateTime(sa.TypeDecorator):
     """Same as ``sa.DateTime`` but adds UTC timezone if missing."""
 
     impl = sa.DateTime
+    # The type has no state besides the arguments of ``sa.DateTime``, so the
+    # statements using it can be cached.
+    cache_ok = True
 
     def __init__(self, *args, **kwargs) -> None:
         kwargs["timezone"] = True
@@ -158,42 +160,6 @@ class User(Base):
         """Update the last activity timestamp to be the current timestamp."""
         self.last_activity_at = utcnow()
 
-    async def select_genre(self, genre: Genre) -> None:
-        """Add a genre to the user's selected genres."""
-        (await self.awaitable_attrs.selected_genres).add(genre)
-
-    async def deselect_genre(self, genre: Genre) -> None:
-        """Remove a genre from the user's selected genres."""
-        (await self.awaitable_attrs.selected_genres).discard(genre)
-
-    async def select_title_type(self, title_type: TitleType) -> None:
-        """Add a title type to the user's selected title types."""
-        (await self.awaitable_attrs.selected_title_types).add(title_type)
-
-    async def deselect_title_type(self, title_type: TitleType) -> None:
-        """Remove a title type from the user's selected title types."""
-        (await self.awaitable_attrs.selected_title_types).discard(title_type)
-
-    async def skip_title(
-        self,
-        title: Title,
-        expires_after: datetime.timedelta = constants.SKIPPED_TITLE_TIMEOUT,
-    ) -> None:
-        """Skip a title."""
-        skipped_titles = await self.awaitable_attrs.skipped_titles
-
-        try:
-            skip = next(
-                skip
-                for skip in skipped_titles
-                if skip.title_id == title.id and skip.user_id == self.id
-            )
-        except StopIteration:
-            skip = TitleSkip(title=title, user=self)
-            skipped_titles.append(skip)
-
-        skip.expires_at = utcnow() + expires_after
-
 
 class Genre(Base, unsafe_hash=True):
     """
@@ -256,6 +222,9 @@ title_genre_table = sa.Table(
         sa.ForeignKey("genre.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # The primary key only helps to look up genres by title. This one is for the
+    # other direction: looking up titles by the genres selected by a user.
+    sa.Index("ix_title_genre_genre_id_title_id", "genre_id", "title_id"),
 )
 
 
@@ -279,16 +248,29 @@ class Title(Base, unsafe_hash=True):
     :var genres: The set of Genre objects associated with the title.
     """
 
+    __table_args__ = (
+        # Matches the filters applied when suggesting a title, and includes the id,
+        # so that the matching titles can be found with an index-only scan. It also
+        # serves lookups by type_id alone, so the column has no index of its own.
+        sa.Index(
+            "ix_title_filter",
+            "type_id",
+            "rating",
+            "votes",
+            postgresql_include=["id"],
+        ),
+    )
+
     id: orm.Mapped[int] = orm.mapped_column(primary_key=True)
     title: orm.Mapped[str]
     type_id: orm.Mapped[int] = orm.mapped_column(
-        sa.ForeignKey(TitleType.id), index=True, init=False, repr=False
+        sa.ForeignKey(TitleType.id), init=False, repr=False
     )
     type: orm.Mapped[TitleType] = orm.relationship(lazy="joined")
     start_year: orm.Mapped[int] = orm.mapped_column(index=True)
     end_year: orm.Mapped[int | None]
-    rating: orm.Mapped[float] = orm.mapped_column(index=True)
-    votes: orm.Mapped[int] = orm.mapped_column(index=True)
+    rating: orm.Mapped[float]
+    votes: orm.Mapped[int]
     genres: orm.Mapped[set["Genre"]] = orm.relationship(
         secondary=title_genre_table, lazy="selectin", hash=False
     )
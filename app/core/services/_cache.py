@@ -0,0 +1,48 @@
+import functools
+import time
+from collections.abc import Awaitable, Callable
+
+import sqlalchemy.ext.asyncio as sa_async
+
+type _Loader[T] = Callable[[sa_async.AsyncSession], Awaitable[T]]
+
+
+class TTLCachedFunction[T]:
+    """A service function whose result is reused for ``ttl`` seconds.
+
+    The session isn't part of the cache key: it's only used to load a fresh
+    result when the cached one is stale. So the result is shared between
+    sessions, and the objects in it may be detached and must only be read.
+    """
+
+    def __init__(self, function: _Loader[T], ttl: float) -> None:
+        functools.update_wrapper(self, function)
+        self._function = function
+        self._ttl = ttl
+        # Expiration time (time.monotonic()) and the cached result.
+        self._entry: tuple[float, T] | None = None
+
+    async def __call__(self, session: sa_async.AsyncSession) -> T:
+        now = time.monotonic()
+        if self._entry is None or self._entry[0] <= now:
+            self._entry = (now + self._ttl, await self._function(session))
+
+        return self._entry[1]
+
+    def cache_clear(self) -> None:
+        """Make the next call query the database."""
+
+        self._entry = None
+
+
+def ttl_cache[T](ttl: float) -> Callable[[_Loader[T]], TTLCachedFunction[T]]:
+    """Reuse the result of a service function for ``ttl`` seconds.
+
+    :param ttl: For how many seconds the result is reused.
+    :return: A decorator.
+    """
+
+    def decorator(function: _Loader[T]) -> TTLCachedFunction[T]:
+        return TTLCachedFunction(function, ttl)
+
+    return decorator
@@ -1,30 +1,73 @@
-from typing import cast
+from collections.abc import Sequence
 
 import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
+from sqlalchemy.dialects import postgresql
 
 from app.core import models
+from app.core.services._cache import ttl_cache
 
+CACHE_TTL: float = 300
+"""For how many seconds the cached list of genres is reused."""
 
-async def list_all(session: sa_async.AsyncSession) -> list[models.Genre]:
-    """List all genres.
+
+async def list_all(session: sa_async.AsyncSession) -> Sequence[models.Genre]:
+    """List all genres sorted by name.
 
     :param session: An SQLAlchemy async session.
-    :return: A list of all genres.
+    :return: A sequence of all genres.
     """
 
-    stmt = sa.select(models.Genre)
-    return list(await session.scalars(stmt))
+    stmt = sa.select(models.Genre).order_by(models.Genre.name)
+    return (await session.scalars(stmt)).all()
 
 
-async def get_by_id(
+@ttl_cache(CACHE_TTL)
+async def list_all_sorted_cached(
     session: sa_async.AsyncSession,
-    genre_id: int,
-) -> models.Genre:
-    """Get genre by ID.
+) -> tuple[models.Genre, ...]:
+    """List all genres sorted by name, reusing the result for ``CACHE_TTL`` seconds.
+
+    Genres only change when titles are imported, so the list is shared between
+    sessions.
+
+    :param session: An SQLAlchemy async session used when the cache is stale.
+    :return: A tuple of all genres sorted by name.
+    """
+
+    return tuple(await list_all(session))
+
+
+def invalidate_cache() -> None:
+    """Make the next ``list_all_sorted_cached`` call query the database."""
+
+    list_all_sorted_cached.cache_clear()
+
+
+async def set_selection(
+    session: sa_async.AsyncSession, user_id: int, genre_id: int, selected: bool
+) -> None:
+    """Select or deselect a genre for a user without loading either of them.
+
+    The ``User.selected_genres`` collection isn't updated, so it should be expired
+    if it's used afterward.
 
     :param session: An SQLAlchemy async session.
+    :param user_id: User ID.
     :param genre_id: Genre ID.
-    :return: A genre.
+    :param selected: ``True`` to select the genre, ``False`` to deselect it.
     """
-    return cast(models.Genre, await session.get_one(models.Genre, genre_id))
+
+    table = models.user_genre_table
+    if selected:
+        stmt = (
+            postgresql.insert(table)
+            .values(user_id=user_id, genre_id=genre_id)
+            .on_conflict_do_nothing()
+        )
+    else:
+        stmt = sa.delete(table).where(
+            table.c.user_id == user_id, table.c.genre_id == genre_id
+        )
+
+    await session.execute(stmt)
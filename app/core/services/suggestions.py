@@ -1,12 +1,13 @@
 import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
+from sqlalchemy.dialects import postgresql
 
+import app.core.constants as constants
 import app.core.models as models
-import app.core.services.title as title_service
 from app.utils import utcnow
 
 
-def _build_filtered_movie_ids_stmt(user: models.User) -> sa.Select:
+async def _build_filtered_movie_ids_stmt(user: models.User) -> sa.Select:
     """
     Build a query that selects a list of title IDs, where all the user filters
     are applied.
@@ -15,52 +16,48 @@ def _build_filtered_movie_ids_stmt(user: models.User) -> sa.Select:
     :return: A select query.
     """
 
-    stmt = sa.select(models.Title.id)
+    # The selections are loaded together with the user, so the ids are passed to
+    # the database instead of joining the user's association tables.
+    title_type_ids = [
+        title_type.id for title_type in await user.awaitable_attrs.selected_title_types
+    ]
+    genre_ids = [genre.id for genre in await user.awaitable_attrs.selected_genres]
 
-    # Apply trivial filters
-    stmt = stmt.where(
+    stmt = sa.select(models.Title.id).where(
+        # Apply trivial filters
         models.Title.rating >= user.minimum_movie_rating,
         models.Title.votes >= user.minimum_movie_votes,
+        # Only selected types
+        models.Title.type_id.in_(title_type_ids),
     )
 
-    # Only selected types
-    stmt = stmt.join(models.User.selected_title_types).join(
-        models.Title, models.Title.type_id == models.TitleType.id
-    )
-
-    # At least one of the selected genres.
-    stmt = (
-        stmt.join(models.Title.genres)
-        .join(
-            models.user_genre_table,
-            models.user_genre_table.c.genre_id == models.Genre.id,
-        )
-        .where(models.user_genre_table.c.user_id == user.id)
-    )
-
-    # All selected genres, if required
     if user.requires_all_selected_genres:
-        # As the user wants titles that have all the selected genres simultaneously,
-        # I am excluding all the titles that don't have some selected genres.
-        # That means that they occur among the selected titles less times than the
-        # number of selected genres.
-        total_number_of_selected_genres_subquery = (
-            sa.select(sa.func.count())
-            .join(models.User.selected_genres)
-            .where(models.User.id == user.id)
-            .scalar_subquery()
+        # Each title has one row per selected genre it has, so the titles that have
+        # all of them are the ones with as many rows as there are selected genres.
+        stmt = (
+            stmt.join(models.title_genre_table)
+            .where(models.title_genre_table.c.genre_id.in_(genre_ids))
+            .group_by(models.Title.id)
+            .having(sa.func.count() >= len(genre_ids))
         )
-        stmt = stmt.group_by(models.Title.id).having(
-            sa.func.count(models.Genre.id) >= total_number_of_selected_genres_subquery
+    else:
+        # At least one of the selected genres. A semi-join stops at the first
+        # matching genre and, unlike a join, yields each title once.
+        has_selected_genre = sa.exists().where(
+            models.title_genre_table.c.title_id == models.Title.id,
+            models.title_genre_table.c.genre_id.in_(genre_ids),
         )
+        stmt = stmt.where(has_selected_genre)
 
-    # Filter skipped titles
-    skipped_titles_ids = sa.select(models.TitleSkip.title_id).where(
+    # Filter skipped titles. Unlike NOT IN, NOT EXISTS is planned as an anti-join,
+    # which looks up each title's skip by the (title_id, user_id) primary key.
+    is_skipped = sa.exists().where(
+        models.TitleSkip.title_id == models.Title.id,
         models.TitleSkip.user_id == user.id,
         models.TitleSkip.expires_at.is_(None)
         | (models.TitleSkip.expires_at > utcnow()),
     )
-    stmt = stmt.where(models.Title.id.not_in(skipped_titles_ids))
+    stmt = stmt.where(~is_skipped)
 
     return stmt
 
@@ -77,7 +74,7 @@ async def suggest_title(
 
     stmt = (
         sa.select(models.Title)
-        .where(models.Title.id.in_(_build_filtered_movie_ids_stmt(user)))
+        .where(models.Title.id.in_(await _build_filtered_movie_ids_stmt(user)))
         .order_by(sa.func.random())
         .limit(1)
     )
@@ -88,13 +85,31 @@ async def suggest_title(
 async def skip_suggested_title(
     session: sa_async.AsyncSession, user: models.User, title_id: int
 ) -> None:
-    """Skip a suggested title for a user.
+    """Skip a suggested title for a user. Missing titles are ignored.
+
+    The skip is upserted with a single statement, without loading the user's
+    skipped titles. ``User.skipped_titles`` isn't updated, so it should be expired
+    if it's used afterward.
 
     :param session: An SQLAlchemy session to interact with the database.
     :param user: The user that wants to skip a suggested title.
     :param title_id: The ID of the title to skip.
     """
 
-    title = await title_service.get_by_id_or_none(session, title_id)
-    if title:
-        await user.skip_title(title)
+    expires_at = utcnow() + constants.SKIPPED_TITLE_TIMEOUT
+
+    # Selecting from the title table makes the insert a no-op for missing titles.
+    stmt = postgresql.insert(models.TitleSkip).from_select(
+        ["title_id", "user_id", "expires_at"],
+        sa.select(
+            models.Title.id,
+            sa.literal(user.id, sa.BigInteger),
+            sa.literal(expires_at, models.TitleSkip.expires_at.type),
+        ).where(models.Title.id == title_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["title_id", "user_id"],
+        set_={"expires_at": stmt.excluded.expires_at},
+    )
+
+    await session.execute(stmt)
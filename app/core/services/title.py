@@ -1,12 +1,12 @@
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Sequence
 from pathlib import Path
 
 import aiofiles.tempfile
-import asyncstdlib.itertools as aitertools
 import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
+from sqlalchemy.dialects import postgresql
 
-from app import aitertools as aitertools_ext
+from app import aitertools
 from app.core import models
 from app.core.services import genre as genre_service
 from app.core.services import title_type as title_type_service
@@ -15,37 +15,35 @@ from app.imdb import downloads, parsers
 BATCH_SIZE_WHEN_REFRESHING: int = 5000
 """How many titles will be imported at once into the database."""
 
+_title_staging_table = sa.table(
+    "title_import",
+    *(
+        sa.column(name)
+        for name in (
+            "id",
+            "title",
+            "type_id",
+            "start_year",
+            "end_year",
+            "rating",
+            "votes",
+        )
+    ),
+)
+"""A temporary table that a batch of imported titles is copied into."""
 
-async def get_by_id_or_none(
-    session: sa_async.AsyncSession, title_id: int
-) -> models.Title | None:
-    """Get a title by its ID.
-
-    :param session: SQLAlchemy async session.
-    :param title_id: Title ID.
-    :return: Title object or ``None`` if not found.
-    """
-
-    return await session.get(models.Title, (title_id,))
-
-
-async def get_multiple_by_ids(
-    session: sa_async.AsyncSession, title_ids: Iterable[int]
-) -> list[models.Title]:
-    """Get multiple titles by their IDs. Missing titles are ignored.
-
-    :param session: SQLAlchemy async session.
-    :param title_ids: Title IDs.
-    :return: List of found titles.
-    """
-
-    stmt = sa.select(models.Title).where(models.Title.id.in_(title_ids))
-    return list(await session.scalars(stmt))
+_title_genre_staging_table = sa.table(
+    "title_genre_import", sa.column("title_id"), sa.column("genre_id")
+)
+"""A temporary table that the genres of a batch of imported titles are copied into."""
 
 
 async def refresh_from_imdb(session: sa_async.AsyncSession) -> None:
     """Refresh titles from the actual IMDB dataset.
 
+    Titles are upserted in bulk, so all objects in the session are expired
+    afterward.
+
     :param session: SQLAlchemy async session.
     """
 
@@ -64,20 +62,17 @@ async def refresh_from_imdb(session: sa_async.AsyncSession) -> None:
         title_ratings_reader = parsers.aiter_title_ratings_dataset(
             paths[downloads.Datasets.TITLE_RATINGS]
         )
-        joined_reader = aitertools_ext.zip_on_same_ordered_attribute(
+        joined_reader = aitertools.zip_on_same_ordered_attribute(
             title_basics_reader, title_ratings_reader, "id"
         )
 
         # Ensure the necessary title types exist
-        movie_tt = await title_type_service.get_or_create_by_name(
-            session=session, name="Movie"
-        )
-        series_tt = await title_type_service.get_or_create_by_name(
-            session=session, name="Series"
-        )
-        mini_series_tt = await title_type_service.get_or_create_by_name(
-            session=session, name="Mini Series"
+        title_types_by_name = await title_type_service.get_or_create_many_by_names(
+            session=session, names=["Movie", "Series", "Mini Series"]
         )
+        movie_tt = title_types_by_name["Movie"]
+        series_tt = title_types_by_name["Series"]
+        mini_series_tt = title_types_by_name["Mini Series"]
 
         # Create mapping of dataset title types to my title types
         title_types = {
@@ -94,49 +89,161 @@ async def refresh_from_imdb(session: sa_async.AsyncSession) -> None:
             if title_basics_record.type in title_types
         )
 
+        title_type_ids = {name: tt.id for name, tt in title_types.items()}
+
         # Import datasets
-        known_genres = await genre_service.list_all(session)
-        known_genres = {genre.name: genre for genre in known_genres}
+        await _create_staging_tables(session)
+        known_genre_ids = {
+            genre.name: genre.id for genre in await genre_service.list_all(session)
+        }
         async for batch in aitertools.batched(records, BATCH_SIZE_WHEN_REFRESHING):
-            batch = list(batch)
-            title_ids_in_batch = [
-                title_basics_record.id for title_basics_record, _ in batch
-            ]
-
-            titles_in_db = await get_multiple_by_ids(session, title_ids_in_batch)
-            titles_in_db = {title.id: title for title in titles_in_db}
-
-            for title_basics_record, title_ratings_record in batch:
-                # Convert genre names to actual models, creating new models if needed.
-                title_genres: set[models.Genre] = set()
-                for genre in title_basics_record.genres:
-                    if genre in known_genres:
-                        title_genres.add(known_genres[genre])
-                    else:
-                        genre = models.Genre(name=genre)
-                        session.add(genre)
-                        title_genres.add(genre)
-                        known_genres[genre.name] = genre
-
-                # Update the title record if it was already present in the database
-                # or create a new one
-                if title := titles_in_db.get(title_basics_record.id):
-                    title.title = title_basics_record.primary_title
-                    title.type = title_types[title_basics_record.type]
-                    title.start_year = title_basics_record.start_year
-                    title.end_year = title_basics_record.end_year
-                    title.rating = title_ratings_record.rating
-                    title.votes = title_ratings_record.votes
-                    title.genres = title_genres
-                else:
-                    title = models.Title(
-                        id=title_basics_record.id,
-                        title=title_basics_record.primary_title,
-                        type=title_types[title_basics_record.type],
-                        start_year=title_basics_record.start_year,
-                        end_year=title_basics_record.end_year,
-                        rating=title_ratings_record.rating,
-                        votes=title_ratings_record.votes,
-                        genres=title_genres,
-                    )
-                    session.add(title)
+            await _upsert_titles(session, batch, title_type_ids, known_genre_ids)
+
+    # The titles were changed without the ORM, so the loaded ones are outdated.
+    session.expire_all()
+
+
+async def _create_staging_tables(session: sa_async.AsyncSession) -> None:
+    """Create temporary tables that batches of imported rows are copied into.
+
+    They are dropped when the transaction ends.
+
+    :param session: SQLAlchemy async session.
+    """
+
+    for staging_table, table_name in (
+        (_title_staging_table, models.Title.__tablename__),
+        (_title_genre_staging_table, models.title_genre_table.name),
+    ):
+        await session.execute(
+            sa.text(
+                f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging_table.name} "
+                f"(LIKE {table_name}) ON COMMIT DROP"
+            )
+        )
+
+
+async def _upsert_titles(
+    session: sa_async.AsyncSession,
+    records: Sequence[tuple[parsers.TitleBasicsRecord, parsers.TitleRatingsRecord]],
+    title_type_ids: dict[str, int],
+    known_genre_ids: dict[str, int],
+) -> None:
+    """Insert or update titles and their genres.
+
+    The rows are copied into the staging tables with ``COPY``, and then merged
+    into the actual tables with a few set-based statements.
+
+    :param session: SQLAlchemy async session.
+    :param records: Matching title basics and ratings records.
+    :param title_type_ids: Title type IDs by the types used in the datasets.
+    :param known_genre_ids: Genre IDs by their names. Genres that are missing
+        there are created and added to it.
+    """
+
+    new_genres = {
+        genre
+        for title_basics_record, _ in records
+        for genre in title_basics_record.genres
+        if genre not in known_genre_ids
+    }
+    if new_genres:
+        known_genre_ids.update(await _create_genres(session, new_genres))
+
+    titles: list[tuple[object, ...]] = []
+    title_genres: list[tuple[int, int]] = []
+    for title_basics_record, title_ratings_record in records:
+        titles.append(
+            (
+                title_basics_record.id,
+                title_basics_record.primary_title,
+                title_type_ids[title_basics_record.type],
+                title_basics_record.start_year,
+                title_basics_record.end_year,
+                title_ratings_record.rating,
+                title_ratings_record.votes,
+            )
+        )
+        for genre in title_basics_record.genres:
+            title_genres.append((title_basics_record.id, known_genre_ids[genre]))
+
+    await session.execute(
+        sa.text(
+            f"TRUNCATE {_title_staging_table.name}, {_title_genre_staging_table.name}"
+        )
+    )
+    await _copy_rows(session, _title_staging_table, titles)
+    await _copy_rows(session, _title_genre_staging_table, title_genres)
+
+    columns = [column.name for column in _title_staging_table.columns]
+    stmt = postgresql.insert(models.Title.__table__).from_select(
+        columns, sa.select(_title_staging_table)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={column: stmt.excluded[column] for column in columns if column != "id"},
+    )
+    await session.execute(stmt)
+
+    # Replace the genres of the titles, keeping the rows that haven't changed.
+    table = models.title_genre_table
+    staging_table = _title_genre_staging_table
+    await session.execute(
+        sa.delete(table).where(
+            table.c.title_id.in_(sa.select(_title_staging_table.c.id)),
+            ~sa.exists().where(
+                staging_table.c.title_id == table.c.title_id,
+                staging_table.c.genre_id == table.c.genre_id,
+            ),
+        )
+    )
+    await session.execute(
+        postgresql.insert(table)
+        .from_select(["title_id", "genre_id"], sa.select(staging_table))
+        .on_conflict_do_nothing()
+    )
+
+
+async def _copy_rows(
+    session: sa_async.AsyncSession,
+    table: sa.TableClause,
+    rows: Iterable[tuple[object, ...]],
+) -> None:
+    """Copy rows into a table with ``COPY ... FROM STDIN``.
+
+    :param session: SQLAlchemy async session.
+    :param table: The table to copy the rows into.
+    :param rows: The rows, with values in the order of the table's columns.
+    """
+
+    columns = ", ".join(column.name for column in table.columns)
+    connection = await session.connection()
+    # COPY isn't supported by SQLAlchemy, so psycopg's connection is used directly.
+    # It's the same connection, so the rows are copied in the same transaction.
+    raw_connection = await connection.get_raw_connection()
+    async with raw_connection.driver_connection.cursor() as cursor:
+        async with cursor.copy(f"COPY {table.name} ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                await copy.write_row(row)
+
+
+async def _create_genres(
+    session: sa_async.AsyncSession, names: Collection[str]
+) -> dict[str, int]:
+    """Create genres found in the datasets, unless they already exist.
+
+    :param session: SQLAlchemy async session.
+    :param names: The names of the genres.
+    :return: Genre IDs by their names.
+    """
+
+    await session.execute(
+        postgresql.insert(models.Genre).on_conflict_do_nothing(),
+        [{"name": name} for name in names],
+    )
+    result = await session.execute(
+        sa.select(models.Genre.name, models.Genre.id).where(
+            models.Genre.name.in_(names)
+        )
+    )
+    return dict(result.tuples().all())
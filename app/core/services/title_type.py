@@ -1,51 +1,97 @@
-from typing import cast
+from collections.abc import Iterable, Sequence
 
 import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
+from sqlalchemy.dialects import postgresql
 
 from app.core import models
+from app.core.services._cache import ttl_cache
 
+CACHE_TTL: float = 300
+"""For how many seconds the cached list of title types is reused."""
 
-async def list_all(session: sa_async.AsyncSession) -> list[models.TitleType]:
+
+async def list_all(session: sa_async.AsyncSession) -> Sequence[models.TitleType]:
     """List all title types.
 
     :param session: An SQLAlchemy async session.
-    :return: A list of all title types.
+    :return: A sequence of all title types.
     """
 
     stmt = sa.select(models.TitleType)
-    return list(await session.scalars(stmt))
+    return (await session.scalars(stmt)).all()
+
+
+@ttl_cache(CACHE_TTL)
+async def list_all_cached(
+    session: sa_async.AsyncSession,
+) -> tuple[models.TitleType, ...]:
+    """List all title types, reusing the result for ``CACHE_TTL`` seconds.
+
+    Title types are reference data that only grows when titles are imported.
+
+    :param session: An SQLAlchemy async session used when the cache is stale.
+    :return: A tuple of all title types.
+    """
+
+    return tuple(await list_all(session))
 
 
-async def get_or_create_by_name(
-    session: sa_async.AsyncSession, name: str
-) -> models.TitleType:
-    """Get or create a title type by its name.
+def invalidate_cache() -> None:
+    """Make the next ``list_all_cached`` call query the database."""
+
+    list_all_cached.cache_clear()
+
+
+async def get_or_create_many_by_names(
+    session: sa_async.AsyncSession, names: Iterable[str]
+) -> dict[str, models.TitleType]:
+    """Get or create title types by their names with a single statement.
 
     :param session: An SQLAlchemy async session.
-    :return: A title type object.
+    :param names: The names of the title types.
+    :return: A mapping of the names to the title type objects.
     """
 
-    title_type = await session.scalar(
-        sa.select(models.TitleType).where(models.TitleType.name == name)
+    stmt = postgresql.insert(models.TitleType).values(
+        [{"name": name} for name in names]
     )
-    if not title_type:
-        title_type = models.TitleType(name=name)
-        session.add(title_type)
+    # Unlike DO NOTHING, a no-op update makes RETURNING include existing rows.
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[models.TitleType.name],
+        set_={"name": stmt.excluded.name},
+    ).returning(models.TitleType)
 
-    return title_type
+    title_types = await session.scalars(
+        stmt, execution_options={"populate_existing": True}
+    )
+    return {title_type.name: title_type for title_type in title_types}
 
 
-async def get_by_id(
-    session: sa_async.AsyncSession, title_type_id: int
-) -> models.TitleType:
-    """Get a title type by its id.
+async def set_selection(
+    session: sa_async.AsyncSession, user_id: int, title_type_id: int, selected: bool
+) -> None:
+    """Select or deselect a title type for a user without loading either of them.
+
+    The ``User.selected_title_types`` collection isn't updated, so expire it before
+    using it again.
 
     :param session: An SQLAlchemy async session.
-    :param title_type_id: The id of the title type.
-    :return: A title type object.
+    :param user_id: User ID.
+    :param title_type_id: Title type ID.
+    :param selected: ``True`` to select the title type, ``False`` to deselect it.
     """
 
-    return cast(
-        models.TitleType, await session.get_one(models.TitleType, (title_type_id,))
-    )
+    table = models.user_title_type_table
+    if selected:
+        stmt = (
+            postgresql.insert(table)
+            .values(user_id=user_id, title_type_id=title_type_id)
+            .on_conflict_do_nothing()
+        )
+    else:
+        stmt = sa.delete(table).where(
+            table.c.user_id == user_id, table.c.title_type_id == title_type_id
+        )
+
+    await session.execute(stmt)
@@ -2,6 +2,7 @@ import typing
 
 import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
+import sqlalchemy.orm as orm
 
 from app.core import models
 
@@ -52,7 +53,17 @@ async def create_or_update_from_data(
     :return: User object.
     """
 
-    user = await get_by_id_or_none(session, user_data.id)
+    # Most scenes render the user's selections, so they are loaded together with
+    # the user instead of lazily later. Joining both collections would multiply
+    # the rows, so each one is loaded by a separate SELECT ... IN.
+    user = await session.get(
+        models.User,
+        (user_data.id,),
+        options=[
+            orm.selectinload(models.User.selected_genres),
+            orm.selectinload(models.User.selected_title_types),
+        ],
+    )
     if user is None:
         user = models.User(id=user_data.id, first_name=user_data.first_name)
         session.add(user)
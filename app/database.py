@@ -4,7 +4,7 @@ This module provides functions for initializing SQLAlchemy for usage in sync and
 async contexts. Usually only one version of an init function should be called.
 """
 
-from typing import Callable
+from typing import Any, Callable
 
 import pydantic
 import pydantic_settings
@@ -17,14 +17,36 @@ class Config(pydantic_settings.BaseSettings, env_prefix="DB_"):
     """Database configuration.
 
     :ivar dsn: Database connection string.
+    :ivar pool_size: The number of connections kept open in the pool.
+    :ivar max_overflow: The number of connections that can be opened on top of
+        ``pool_size`` under load.
+    :ivar pool_pre_ping: Whether to check connections before using them. It costs
+        a round trip per checkout, but weeds out connections closed by the server.
+    :ivar insertmanyvalues_page_size: How many rows are sent in a single INSERT
+        statement when inserting many rows at once.
     """
 
     dsn: pydantic.PostgresDsn
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = False
+    insertmanyvalues_page_size: int = 1000
 
     @property
     def sqlalchemy_url(self) -> str:
         return str(self.dsn)
 
+    @property
+    def engine_options(self) -> dict[str, Any]:
+        """Keyword arguments for creating an engine, besides the URL."""
+
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_pre_ping": self.pool_pre_ping,
+            "insertmanyvalues_page_size": self.insertmanyvalues_page_size,
+        }
+
 
 def init_sync(config: Config) -> tuple[sa.Engine, Callable[[], orm.Session]]:
     """Initialize SQLAlchemy for usage in sync code (usual SA).
@@ -33,7 +55,7 @@ def init_sync(config: Config) -> tuple[sa.Engine, Callable[[], orm.Session]]:
     :return: SQLAlchemy engine and session factory.
     """
 
-    engine = sa.create_engine(config.sqlalchemy_url)
+    engine = sa.create_engine(config.sqlalchemy_url, **config.engine_options)
     session_factory = orm.sessionmaker(bind=engine)
     return engine, session_factory
 
@@ -49,6 +71,8 @@ def init_async(
     :param config: Database configuration.
     :return: SQLAlchemy engine and session factory.
     """
-    engine = sa_async.create_async_engine(config.sqlalchemy_url)
+    engine = sa_async.create_async_engine(
+        config.sqlalchemy_url, **config.engine_options
+    )
     session_factory = sa_async.async_sessionmaker(bind=engine, expire_on_commit=False)
     return engine, session_factory
@@ -1,6 +1,7 @@
+import asyncio
 import csv
-import io
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import ProcessPoolExecutor
 from os import PathLike
 from typing import NamedTuple, Protocol
 
@@ -25,17 +26,17 @@ csv.register_dialect("imdb", IMDBDialect)
 class _AsyncReadableFile(Protocol):
     async def readline(self) -> str: ...
 
-    async def readlines(self, hint: int | None = -1) -> str: ...
+    async def readlines(self, hint: int | None = -1) -> list[str]: ...
 
 
-READ_LINES_HINT = 10 * 1024  # 10 KiB
+READ_LINES_HINT = 1024 * 1024  # 1 MiB
 """How many bytes to read from the file at once."""
 
 MISSING_VALUE = "\\N"
 """The value used to indicate that a value is missing."""
 
 
-async def _async_reader(afp: _AsyncReadableFile) -> AsyncGenerator[str]:
+async def _async_reader(afp: _AsyncReadableFile) -> AsyncGenerator[list[str]]:
     """A more performant way to iterate over a file asynchronously.
 
     Reduces the number of calls into an executor by reading multiple lines at a time.
@@ -44,13 +45,12 @@ async def _async_reader(afp: _AsyncReadableFile) -> AsyncGenerator[str]:
     line.
 
     :param afp: An async file-like object that supports ``readlines()``.
-    :return: An async generator that yields lines from the file.
+    :return: An async generator that yields chunks of lines from the file.
     """
 
     lines = await afp.readlines(READ_LINES_HINT)
     while lines:
-        for line in lines:
-            yield line
+        yield lines
         lines = await afp.readlines(READ_LINES_HINT)
 
 
@@ -58,28 +58,60 @@ def _convert_missing_values(row: dict[str, str]) -> dict[str, str | None]:
     return {key: value if value != "\\N" else None for key, value in row.items()}
 
 
-async def _async_dict_reader(afp: _AsyncReadableFile) -> AsyncGenerator[dict[str, str]]:
-    buffer = io.StringIO()
-    sync_reader = csv.DictReader(buffer, dialect="imdb")
+def _parse_lines[T](
+    fieldnames: list[str],
+    lines: list[str],
+    parse_row: Callable[[dict[str, str | None]], T | None],
+) -> list[T]:
+    records = []
+    for fields in csv.reader(lines, dialect="imdb"):
+        # Every line has to be a complete row. Empty lines are broken too.
+        if len(fields) != len(fieldnames):
+            raise ValueError("Dataset is broken")
 
-    header = await afp.readline()
-    buffer.write(header)
+        record = parse_row(_convert_missing_values(dict(zip(fieldnames, fields))))
+        if record is not None:
+            records.append(record)
+    return records
 
-    async for line in _async_reader(afp):
-        buffer.write(line)
-        # To make the buffer readable.
-        buffer.seek(0)
 
-        # The way it's written should guarantee that StopIteration is never raised.
-        # It always has a new line in the buffer before next() is called.
-        try:
-            yield _convert_missing_values(next(sync_reader))
-        except StopIteration:
-            raise ValueError("Dataset is broken") from None
+async def _aiter_records[T](
+    filepath: str | PathLike[str],
+    parse_row: Callable[[dict[str, str | None]], T | None],
+) -> AsyncGenerator[T]:
+    """Parse a dataset into records.
+
+    Parsing is CPU-bound, so chunks of lines are parsed in a separate process,
+    outside the GIL of the importer. The next chunk is already being parsed while
+    the records of the current one are consumed.
+
+    :param filepath: The path to the dataset file.
+    :param parse_row: A function that converts a row to a record, or returns
+        ``None`` to skip the row. It's sent to the worker process, so it has to be
+        defined at module level.
+    :return: An async generator that yields records from the dataset.
+    :raise ValueError: If the dataset is broken.
+    """
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        async with aiofiles.open(filepath, "r") as dataset_file:
+            header = await dataset_file.readline()
+            fieldnames = next(csv.reader([header], dialect="imdb"))
+
+            parsing: asyncio.Future[list[T]] | None = None
+            async for lines in _async_reader(dataset_file):
+                next_parsing = loop.run_in_executor(
+                    pool, _parse_lines, fieldnames, lines, parse_row
+                )
+                if parsing is not None:
+                    for record in await parsing:
+                        yield record
+                parsing = next_parsing
 
-        # clear the buffer
-        buffer.seek(0)
-        buffer.truncate()
+            if parsing is not None:
+                for record in await parsing:
+                    yield record
 
 
 def _tconst_to_id(tconst: str) -> int:
@@ -105,6 +137,28 @@ class TitleBasicsRecord(NamedTuple):
     genres: list[str]
 
 
+def _parse_title_basics_row(row: dict[str, str | None]) -> TitleBasicsRecord | None:
+    non_none_values = [
+        row["tconst"],
+        row["titleType"],
+        row["primaryTitle"],
+        row["startYear"],
+        row["genres"],
+    ]
+    # skip the row if the necessary data is not present
+    if not all(non_none_values):
+        return None
+
+    return TitleBasicsRecord(
+        id=_tconst_to_id(row["tconst"]),
+        type=row["titleType"],
+        primary_title=row["primaryTitle"],
+        start_year=int(row["startYear"]),
+        end_year=int(row["endYear"]) if row["endYear"] else None,
+        genres=row["genres"].split(","),
+    )
+
+
 async def aiter_title_basics_dataset(
     filepath: str | PathLike[str],
 ) -> AsyncGenerator[TitleBasicsRecord]:
@@ -114,27 +168,8 @@ async def aiter_title_basics_dataset(
     :return: An async generator that yields records from the dataset.
     """
 
-    async with aiofiles.open(filepath, "r") as dataset_file:
-        reader = _async_dict_reader(dataset_file)
-
-        async for row in reader:
-            non_none_values = [
-                row["tconst"],
-                row["titleType"],
-                row["primaryTitle"],
-                row["startYear"],
-                row["genres"],
-            ]
-            # skip the row if the necessary data is not present
-            if all(non_none_values):
-                yield TitleBasicsRecord(
-                    id=_tconst_to_id(row["tconst"]),
-                    type=row["titleType"],
-                    primary_title=row["primaryTitle"],
-                    start_year=int(row["startYear"]),
-                    end_year=int(row["endYear"]) if row["endYear"] else None,
-                    genres=row["genres"].split(","),
-                )
+    async for record in _aiter_records(filepath, _parse_title_basics_row):
+        yield record
 
 
 class TitleRatingsRecord(NamedTuple):
@@ -150,6 +185,21 @@ class TitleRatingsRecord(NamedTuple):
     votes: int
 
 
+def _parse_title_ratings_row(
+    row: dict[str, str | None],
+) -> TitleRatingsRecord | None:
+    non_none_values = [row["tconst"], row["averageRating"], row["numVotes"]]
+    # skip the row if the necessary data is not present
+    if not all(non_none_values):
+        return None
+
+    return TitleRatingsRecord(
+        id=_tconst_to_id(row["tconst"]),
+        rating=float(row["averageRating"]),
+        votes=int(row["numVotes"]),
+    )
+
+
 async def aiter_title_ratings_dataset(
     filepath: str | PathLike[str],
 ) -> AsyncGenerator[TitleRatingsRecord]:
@@ -159,15 +209,5 @@ async def aiter_title_ratings_dataset(
     :return: An async generator that yields records from the dataset.
     """
 
-    async with aiofiles.open(filepath, "r") as dataset_file:
-        reader = _async_dict_reader(dataset_file)
-
-        async for row in reader:
-            non_none_values = [row["tconst"], row["averageRating"], row["numVotes"]]
-            # skip the row if the necessary data is not present
-            if all(non_none_values):
-                yield TitleRatingsRecord(
-                    id=_tconst_to_id(row["tconst"]),
-                    rating=float(row["averageRating"]),
-                    votes=int(row["numVotes"]),
-                )
+    async for record in _aiter_records(filepath, _parse_title_ratings_row):
+        yield record
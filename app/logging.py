@@ -9,11 +9,16 @@ import loguru
 import pydantic_settings
 from loguru import logger
 
-__all__ = ["Config", "init", "logger"]
+__all__ = ["Config", "init", "is_enabled", "logger"]
 
 type LogLevel = typing.Literal["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 
+_min_level_no: int = 0
+"""The severity of the level configured by ``init()``. Until it's called, all
+levels are considered enabled."""
+
+
 class Config(pydantic_settings.BaseSettings, env_prefix="LOG_"):
     """Logging configuration.
 
@@ -57,6 +62,8 @@ def init(config: Config) -> None:
     :param config: Logging configuration.
     """
 
+    global _min_level_no
+
     # Setup interception of logs from the standard logging library.
     logging.basicConfig(handlers=[_InterceptHandler()], level=0, force=True)
 
@@ -67,3 +74,16 @@ def init(config: Config) -> None:
         level=config.level,
         diagnose=config.diagnose,
     )
+    _min_level_no = loguru.logger.level(config.level).no
+
+
+def is_enabled(level: LogLevel) -> bool:
+    """Check whether messages of the given level pass the configured level.
+
+    Useful to skip preparing expensive debug data that won't be logged anyway.
+
+    :param level: Logging level.
+    :return: ``True`` if messages of the given level may be logged.
+    """
+
+    return logger.level(level).no >= _min_level_no
@@ -1,3 +1,4 @@
+import asyncio
 from typing import cast
 from unittest import mock
 
@@ -7,7 +8,11 @@ from aiogram.methods import DeleteMessages
 from aiogram.types import Chat, Message, User
 from testfixtures import SequenceComparison as S
 
-from app.bot.scenes._autocleanupscene import AutoCleanupScene
+from app.bot.scenes._autocleanupscene import (
+    MAX_MESSAGES_TO_DELETE_AT_ONCE,
+    AutoCleanupScene,
+    _background_cleanups,
+)
 from app.testing.constants import RANDOM_DATETIME
 from app.testing.mockedbot import MockedBot
 from app.testing.scenes import FakeSceneWizard
@@ -31,7 +36,7 @@ async def test_exit_via_message(scene: AutoCleanupScene, mocked_bot: MockedBot)
 
     await scene.exit_via_message(FAKE_MESSAGE, mocked_bot)
 
-    scene.cleanup.assert_called_once_with(mocked_bot)
+    scene.cleanup.assert_called_once_with(mocked_bot, wait=False)
 
 
 async def test_register_for_cleanup_without_previous_messages(
@@ -64,11 +69,59 @@ async def test_cleanup(
 
     await scene.cleanup(mocked_bot)
 
-    assert mocked_bot.calls == [
+    assert mocked_bot.calls == S(
         DeleteMessages(chat_id=0, message_ids=[0]),
         # Disable pydantic's validation
         DeleteMessages.model_construct(
             chat_id=2, message_ids=S(1, 2, 3, ordered=False)
         ),
-    ]
+        ordered=False,
+    )
+    assert await scene_wizard.get_value("messages_to_delete") == []
+
+
+async def test_cleanup_without_waiting(
+    scene: AutoCleanupScene, mocked_bot: MockedBot, scene_wizard: FakeSceneWizard
+) -> None:
+    await scene_wizard.update_data(messages_to_delete=[(1, 2)])
+
+    await scene.cleanup(mocked_bot, wait=False)
+
     assert await scene_wizard.get_value("messages_to_delete") == []
+    await asyncio.gather(*_background_cleanups)
+    assert mocked_bot.calls == [DeleteMessages(chat_id=2, message_ids=[1])]
+
+
+async def test_cleanup_deletes_duplicates_once(
+    scene: AutoCleanupScene, mocked_bot: MockedBot, scene_wizard: FakeSceneWizard
+) -> None:
+    await scene.register_for_cleanup(FAKE_MESSAGE)
+    await scene.register_for_cleanup(FAKE_MESSAGE)
+
+    await scene.cleanup(mocked_bot)
+
+    assert mocked_bot.calls == [
+        DeleteMessages(
+            chat_id=FAKE_MESSAGE.chat.id, message_ids=[FAKE_MESSAGE.message_id]
+        )
+    ]
+
+
+async def test_cleanup_splits_messages_into_chunks(
+    scene: AutoCleanupScene, mocked_bot: MockedBot, scene_wizard: FakeSceneWizard
+) -> None:
+    message_ids = list(range(MAX_MESSAGES_TO_DELETE_AT_ONCE + 1))
+    await scene_wizard.update_data(
+        messages_to_delete=[(message_id, 2) for message_id in message_ids]
+    )
+
+    await scene.cleanup(mocked_bot)
+
+    assert len(mocked_bot.calls) == 2
+    assert sorted(
+        message_id for call in mocked_bot.calls for message_id in call.message_ids
+    ) == message_ids
+    assert all(
+        len(call.message_ids) <= MAX_MESSAGES_TO_DELETE_AT_ONCE
+        for call in mocked_bot.calls
+    )
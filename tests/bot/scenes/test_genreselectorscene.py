@@ -3,7 +3,11 @@ from unittest import mock
 
 import pytest
 from aiogram.fsm.scene import SceneWizard
-from aiogram.methods import EditMessageText
+from aiogram.methods import (
+    AnswerCallbackQuery,
+    EditMessageReplyMarkup,
+    EditMessageText,
+)
 from aiogram.types import (
     CallbackQuery,
     InlineKeyboardButton,
@@ -19,7 +23,7 @@ from app.bot.scenes import GenreSelectorScene
 from app.bot.scenes.genreselectorscene import GenreButtonCD, GenreCombinatorButtonCD
 from app.core import models
 from app.testing.mockedbot import MockedBot
-from app.testing.scenes import BackSceneAction, FakeSceneWizard, RetakeSceneAction
+from app.testing.scenes import BackSceneAction, FakeSceneWizard
 from app.utils import awaitable
 
 
@@ -77,8 +81,8 @@ async def test_construct_message_keyboard(
     all_genres = [models.Genre(name=f"Genre #{i}") for i in range(1, 6)]
     sa_async_session.add_all(all_genres)
 
-    await user.select_genre(all_genres[0])
-    await user.select_genre(all_genres[3])
+    (await user.awaitable_attrs.selected_genres).add(all_genres[0])
+    (await user.awaitable_attrs.selected_genres).add(all_genres[3])
 
     await sa_async_session.flush()
 
@@ -149,9 +153,8 @@ async def test_handle_genre_button_clicked_selected(
 
     await sa_async_session.refresh(user)
     assert await user.awaitable_attrs.selected_genres == {genre}
-    assert scene_wizard.scene_actions == [
-        RetakeSceneAction(data={"_with_history": False})
-    ]
+    assert scene_wizard.scene_actions == []
+    assert isinstance(mocked_bot.calls[-1], EditMessageReplyMarkup)
 
 
 async def test_handle_genre_button_clicked_deselected(
@@ -161,8 +164,10 @@ async def test_handle_genre_button_clicked_deselected(
     fake_tg_callback_query: CallbackQuery,
     genre: models.Genre,
     scene_wizard: FakeSceneWizard,
+    mocked_bot: MockedBot,
 ) -> None:
-    await user.select_genre(genre)
+    (await user.awaitable_attrs.selected_genres).add(genre)
+    await sa_async_session.commit()
     callback_data = GenreButtonCD(
         genre_id=genre.id,
         selected=False,
@@ -176,10 +181,9 @@ async def test_handle_genre_button_clicked_deselected(
     )
 
     await sa_async_session.refresh(user)
-    assert not await user.awaitable_attrs.selected_title_types
-    assert scene_wizard.scene_actions == [
-        RetakeSceneAction(data={"_with_history": False})
-    ]
+    assert not await user.awaitable_attrs.selected_genres
+    assert scene_wizard.scene_actions == []
+    assert isinstance(mocked_bot.calls[-1], EditMessageReplyMarkup)
 
 
 @pytest.mark.parametrize("require_all", [True, False])
@@ -194,6 +198,8 @@ async def test_handle_genre_combinator_button_clicked(
     mocked_bot: MockedBot,
     scene_wizard: FakeSceneWizard,
 ) -> None:
+    user.requires_all_selected_genres = not require_all
+    await sa_async_session.commit()
     callback_data = GenreCombinatorButtonCD(require_all=require_all)
 
     await scene.handle_genre_combinator_button_click(
@@ -205,9 +211,30 @@ async def test_handle_genre_combinator_button_clicked(
 
     await sa_async_session.refresh(user)
     assert user.requires_all_selected_genres == require_all
-    assert scene_wizard.scene_actions == [
-        RetakeSceneAction(data={"_with_history": False})
-    ]
+    assert scene_wizard.scene_actions == []
+    assert isinstance(mocked_bot.calls[-1], EditMessageReplyMarkup)
+
+
+async def test_handle_genre_button_clicked_same_value(
+    scene: GenreSelectorScene,
+    user: models.User,
+    sa_async_session: AsyncSession,
+    fake_tg_callback_query: CallbackQuery,
+    genre: models.Genre,
+    mocked_bot: MockedBot,
+) -> None:
+    (await user.awaitable_attrs.selected_genres).add(genre)
+    await sa_async_session.commit()
+    callback_data = GenreButtonCD(genre_id=genre.id, selected=True)
+
+    await scene.handle_genre_button_click(
+        callback_query=fake_tg_callback_query,
+        user=user,
+        callback_data=callback_data,
+        session=sa_async_session,
+    )
+
+    assert [type(call) for call in mocked_bot.calls] == [AnswerCallbackQuery]
 
 
 async def test_exit_via_message(
@@ -217,4 +244,4 @@ async def test_exit_via_message(
 
     await scene.exit_via_message(fake_tg_message, mocked_bot)
 
-    scene.cleanup.assert_awaited_once_with(mocked_bot)
+    scene.cleanup.assert_awaited_once_with(mocked_bot, wait=False)
@@ -2,7 +2,7 @@ from typing import cast
 
 import pytest
 from aiogram.fsm.scene import SceneWizard
-from aiogram.methods import EditMessageText
+from aiogram.methods import EditMessageReplyMarkup, EditMessageText
 from aiogram.types import (
     CallbackQuery,
     InlineKeyboardButton,
@@ -20,7 +20,7 @@ from app.bot.scenes.minimummovieratingselectorscene import (
 )
 from app.core import models
 from app.testing.mockedbot import MockedBot
-from app.testing.scenes import BackSceneAction, FakeSceneWizard, RetakeSceneAction
+from app.testing.scenes import BackSceneAction, FakeSceneWizard
 
 
 @pytest.fixture()
@@ -37,7 +37,7 @@ async def test_exit_via_message(
 
     await scene.exit_via_message(fake_tg_message, mocked_bot)
 
-    scene.cleanup.assert_awaited_once_with(mocked_bot)
+    scene.cleanup.assert_awaited_once_with(mocked_bot, wait=False)
 
 
 async def test_handle_back_button_click(
@@ -187,6 +187,7 @@ async def test_handle_movie_rating_button_click(
     sa_async_session: AsyncSession,
     fake_tg_callback_query: CallbackQuery,
     scene_wizard: FakeSceneWizard,
+    mocked_bot: MockedBot,
 ) -> None:
     callback_data = MovieRatingButtonCD(rating=9)
 
@@ -199,6 +200,5 @@ async def test_handle_movie_rating_button_click(
 
     await sa_async_session.refresh(user)
     assert user.minimum_movie_rating == 9
-    assert scene_wizard.scene_actions == [
-        RetakeSceneAction(data={"_with_history": False})
-    ]
+    assert scene_wizard.scene_actions == []
+    assert isinstance(mocked_bot.calls[-1], EditMessageReplyMarkup)
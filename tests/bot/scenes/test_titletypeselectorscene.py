@@ -3,7 +3,7 @@ from unittest import mock
 
 import pytest
 from aiogram.fsm.scene import SceneWizard
-from aiogram.methods import EditMessageText
+from aiogram.methods import EditMessageReplyMarkup, EditMessageText
 from aiogram.types import (
     CallbackQuery,
     InlineKeyboardButton,
@@ -19,7 +19,7 @@ from app.bot.scenes import TitleTypeSelectorScene
 from app.bot.scenes.titletypeselectorscene import TitleTypeButton
 from app.core import models
 from app.testing.mockedbot import MockedBot
-from app.testing.scenes import BackSceneAction, FakeSceneWizard, RetakeSceneAction
+from app.testing.scenes import BackSceneAction, FakeSceneWizard
 from app.utils import awaitable
 
 
@@ -68,7 +68,7 @@ async def test_exit_via_message(
 
     await scene.exit_via_message(fake_tg_message, mocked_bot)
 
-    scene.cleanup.assert_called_once_with(mocked_bot)
+    scene.cleanup.assert_called_once_with(mocked_bot, wait=False)
 
 
 async def test_handle_back_button_click(
@@ -92,7 +92,7 @@ async def test_construct_message_keyboard(
     all_title_types[1].id = 2
 
     monkeypatch.setattr(
-        "app.core.services.title_type.list_all",
+        "app.core.services.title_type.list_all_cached",
         lambda session: awaitable(all_title_types),
     )
 
@@ -151,9 +151,8 @@ async def test_handle_title_type_button_clicked_selected(
 
     await sa_async_session.refresh(user)
     assert await user.awaitable_attrs.selected_title_types == {title_type}
-    assert scene_wizard.scene_actions == [
-        RetakeSceneAction(data={"_with_history": False})
-    ]
+    assert scene_wizard.scene_actions == []
+    assert isinstance(mocked_bot.calls[-1], EditMessageReplyMarkup)
 
 
 async def test_handle_title_type_button_clicked_deselected(
@@ -163,8 +162,10 @@ async def test_handle_title_type_button_clicked_deselected(
     fake_tg_callback_query: CallbackQuery,
     title_type: models.TitleType,
     scene_wizard: FakeSceneWizard,
+    mocked_bot: MockedBot,
 ) -> None:
-    await user.select_title_type(title_type)
+    (await user.awaitable_attrs.selected_title_types).add(title_type)
+    await sa_async_session.commit()
     callback_data = TitleTypeButton(
         title_type_id=title_type.id,
         selected=False,
@@ -177,10 +178,7 @@ async def test_handle_title_type_button_clicked_deselected(
         session=sa_async_session,
     )
 
-    assert not user.selected_title_types
-
     await sa_async_session.refresh(user)
     assert not await user.awaitable_attrs.selected_title_types
-    assert scene_wizard.scene_actions == [
-        RetakeSceneAction(data={"_with_history": False})
-    ]
+    assert scene_wizard.scene_actions == []
+    assert isinstance(mocked_bot.calls[-1], EditMessageReplyMarkup)
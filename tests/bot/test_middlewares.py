@@ -208,3 +208,15 @@ class TestLoggingMiddleware:
         await middlewares.logging_middleware(empty_handler, EVENT, middleware_data)
 
         logot.assert_logged(logged.debug("FSM data: {'foo': 'bar'}"))
+
+    async def test_fsm_is_not_read_when_debug_is_disabled(
+        self, middleware_data: ExtendedMiddlewareData, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(middlewares, "is_logging_enabled", lambda level: False)
+        state = mock.AsyncMock(spec=FSMContext)
+        middleware_data["state"] = state
+
+        await middlewares.logging_middleware(empty_handler, EVENT, middleware_data)
+
+        state.get_state.assert_not_awaited()
+        state.get_data.assert_not_awaited()
@@ -9,6 +9,8 @@ from loguru import logger
 
 import app.database
 from app.core import models
+from app.core.services import genre as genre_service
+from app.core.services import title_type as title_type_service
 
 
 def pytest_addoption(parser: pytest.Parser):
@@ -34,6 +36,14 @@ def disable_logs_by_default() -> None:
     logger.remove()
 
 
+@pytest.fixture(autouse=True)
+def invalidate_reference_data_caches() -> None:
+    # Every test has its own database, so genres and title types mustn't leak
+    # between them.
+    genre_service.invalidate_cache()
+    title_type_service.invalidate_cache()
+
+
 @pytest.fixture(scope="session")
 def db_config():
     try:
@@ -0,0 +1,33 @@
+from typing import cast
+from unittest import mock
+
+from freezegun.api import FrozenDateTimeFactory
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.services._cache import ttl_cache
+
+SESSION = cast(AsyncSession, mock.sentinel.session)
+
+
+async def test_result_is_reused_until_ttl_expires(
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    load = mock.AsyncMock(side_effect=[1, 2])
+    cached_load = ttl_cache(10)(load)
+
+    assert await cached_load(SESSION) == 1
+    freezer.tick(9)
+    assert await cached_load(SESSION) == 1
+    freezer.tick(1)
+    assert await cached_load(SESSION) == 2
+
+
+async def test_cache_clear() -> None:
+    load = mock.AsyncMock(side_effect=[1, 2])
+    cached_load = ttl_cache(10)(load)
+
+    await cached_load(SESSION)
+    cached_load.cache_clear()
+
+    assert await cached_load(SESSION) == 2
+    load.assert_awaited_with(SESSION)
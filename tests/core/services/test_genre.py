@@ -1,7 +1,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.models import Genre
+from app.core.models import Genre, User
 from app.core.services import genre as genre_service
 
 
@@ -24,5 +24,72 @@ async def test_list_all(
     assert await genre_service.list_all(sa_async_session) == genre_list
 
 
-async def test_get_by_id(sa_async_session: AsyncSession, genre: Genre) -> None:
-    assert await genre_service.get_by_id(sa_async_session, genre.id) == genre
+class TestListAllSortedCached:
+    async def test_genres_are_sorted_by_name(
+        self, sa_async_session: AsyncSession
+    ) -> None:
+        genres = [Genre(name="b"), Genre(name="c"), Genre(name="a")]
+        sa_async_session.add_all(genres)
+        await sa_async_session.commit()
+
+        assert await genre_service.list_all_sorted_cached(sa_async_session) == (
+            genres[2],
+            genres[0],
+            genres[1],
+        )
+
+    async def test_result_is_cached(
+        self, sa_async_session: AsyncSession, genre_list: list[Genre]
+    ) -> None:
+        await genre_service.list_all_sorted_cached(sa_async_session)
+        sa_async_session.add(Genre(name="test4"))
+        await sa_async_session.commit()
+
+        assert await genre_service.list_all_sorted_cached(sa_async_session) == tuple(
+            genre_list
+        )
+
+    async def test_cache_can_be_invalidated(
+        self, sa_async_session: AsyncSession, genre_list: list[Genre]
+    ) -> None:
+        await genre_service.list_all_sorted_cached(sa_async_session)
+        new_genre = Genre(name="test4")
+        sa_async_session.add(new_genre)
+        await sa_async_session.commit()
+
+        genre_service.invalidate_cache()
+
+        assert await genre_service.list_all_sorted_cached(sa_async_session) == (
+            *genre_list,
+            new_genre,
+        )
+
+
+class TestSetSelection:
+    async def test_selects_genre(
+        self, sa_async_session: AsyncSession, user: User, genre: Genre
+    ) -> None:
+        await genre_service.set_selection(sa_async_session, user.id, genre.id, True)
+
+        sa_async_session.expire(user, ["selected_genres"])
+        assert await user.awaitable_attrs.selected_genres == {genre}
+
+    async def test_selecting_twice_is_noop(
+        self, sa_async_session: AsyncSession, user: User, genre: Genre
+    ) -> None:
+        await genre_service.set_selection(sa_async_session, user.id, genre.id, True)
+        await genre_service.set_selection(sa_async_session, user.id, genre.id, True)
+
+        sa_async_session.expire(user, ["selected_genres"])
+        assert await user.awaitable_attrs.selected_genres == {genre}
+
+    async def test_deselects_genre(
+        self, sa_async_session: AsyncSession, user: User, genre: Genre
+    ) -> None:
+        (await user.awaitable_attrs.selected_genres).add(genre)
+        await sa_async_session.commit()
+
+        await genre_service.set_selection(sa_async_session, user.id, genre.id, False)
+
+        sa_async_session.expire(user, ["selected_genres"])
+        assert await user.awaitable_attrs.selected_genres == set()
@@ -1,4 +1,5 @@
 import pytest
+import sqlalchemy as sa
 from freezegun.api import FrozenDateTimeFactory
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -36,12 +37,12 @@ async def user_without_filters(
     user.minimum_movie_votes = 0
 
     # Select all title types
-    await user.select_title_type(title_type)
-    await user.select_title_type(other_title_type)
+    (await user.awaitable_attrs.selected_title_types).add(title_type)
+    (await user.awaitable_attrs.selected_title_types).add(other_title_type)
 
     # Select all genres
-    await user.select_genre(genre)
-    await user.select_genre(other_genre)
+    (await user.awaitable_attrs.selected_genres).add(genre)
+    (await user.awaitable_attrs.selected_genres).add(other_genre)
 
     return user
 
@@ -130,7 +131,28 @@ async def test_suggest_title_only_selected_title_types(
     user_without_filters: models.User,
     title: models.Title,
 ) -> None:
-    await user_without_filters.deselect_title_type(title.type)
+    title_types = await user_without_filters.awaitable_attrs.selected_title_types
+    title_types.discard(title.type)
+
+    suggestion = await suggestion_service.suggest_title(
+        sa_async_session, user_without_filters
+    )
+    assert suggestion is None
+
+
+async def test_suggest_title_ignores_title_types_selected_by_other_users(
+    sa_async_session: AsyncSession,
+    user_without_filters: models.User,
+    title: models.Title,
+) -> None:
+    other_user = models.User(
+        id=user_without_filters.id + 1,
+        first_name="Jane",
+        selected_title_types={title.type},
+    )
+    sa_async_session.add(other_user)
+    title_types = await user_without_filters.awaitable_attrs.selected_title_types
+    title_types.discard(title.type)
 
     suggestion = await suggestion_service.suggest_title(
         sa_async_session, user_without_filters
@@ -144,7 +166,7 @@ async def test_suggest_title_at_leat_one_of_selected_genres(
     title: models.Title,
     genre: models.Genre,
 ) -> None:
-    await user_without_filters.deselect_genre(genre)
+    (await user_without_filters.awaitable_attrs.selected_genres).discard(genre)
 
     suggestion = await suggestion_service.suggest_title(
         sa_async_session, user_without_filters
@@ -152,6 +174,23 @@ async def test_suggest_title_at_leat_one_of_selected_genres(
     assert suggestion is None
 
 
+async def test_suggest_title_counts_title_with_several_selected_genres_once(
+    sa_async_session: AsyncSession,
+    user_without_filters: models.User,
+    title: models.Title,
+    genre: models.Genre,
+    other_genre: models.Genre,
+) -> None:
+    title.genres = {genre, other_genre}
+
+    stmt = await suggestion_service._build_filtered_movie_ids_stmt(
+        user_without_filters
+    )
+    title_ids = list(await sa_async_session.scalars(stmt))
+
+    assert title_ids == [title.id]
+
+
 async def test_suggest_title_all_selected_genres_satisfied(
     sa_async_session: AsyncSession,
     user_without_filters: models.User,
@@ -176,7 +215,7 @@ async def test_suggest_title_all_selected_genres_satisfied_when_subset(
 ) -> None:
     user = user_without_filters
     user.requires_all_selected_genres = True
-    await user.deselect_genre(other_genre)
+    (await user.awaitable_attrs.selected_genres).discard(other_genre)
     title.genres = {genre, other_genre}
 
     suggestion = await suggestion_service.suggest_title(sa_async_session, user)
@@ -201,7 +240,7 @@ async def test_suggest_title_excludes_skipped_titles(
     title: models.Title,
 ) -> None:
     user = user_without_filters
-    await user.skip_title(title)
+    await suggestion_service.skip_suggested_title(sa_async_session, user, title.id)
 
     suggestion = await suggestion_service.suggest_title(sa_async_session, user)
     assert suggestion is None
@@ -216,8 +255,46 @@ async def test_suggest_title_doesnt_exclude_skipped_titles_after_timeout(
     user = user_without_filters
 
     # Make the skip expired
-    await user.skip_title(title)
+    await suggestion_service.skip_suggested_title(sa_async_session, user, title.id)
     freezer.move_to(2 * constants.SKIPPED_TITLE_TIMEOUT)
 
     suggestion = await suggestion_service.suggest_title(sa_async_session, user)
     assert suggestion == title
+
+
+class TestSkipSuggestedTitle:
+    async def test_title_is_skipped(
+        self,
+        sa_async_session: AsyncSession,
+        user_without_filters: models.User,
+        title: models.Title,
+    ) -> None:
+        user = user_without_filters
+
+        await suggestion_service.skip_suggested_title(sa_async_session, user, title.id)
+
+        assert await suggestion_service.suggest_title(sa_async_session, user) is None
+
+    async def test_skip_is_extended_when_skipped_again(
+        self,
+        sa_async_session: AsyncSession,
+        user_without_filters: models.User,
+        title: models.Title,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        user = user_without_filters
+        await suggestion_service.skip_suggested_title(sa_async_session, user, title.id)
+        freezer.tick(constants.SKIPPED_TITLE_TIMEOUT / 2)
+
+        await suggestion_service.skip_suggested_title(sa_async_session, user, title.id)
+        freezer.tick(constants.SKIPPED_TITLE_TIMEOUT * 3 / 4)
+
+        assert await suggestion_service.suggest_title(sa_async_session, user) is None
+
+    async def test_missing_title_is_ignored(
+        self, sa_async_session: AsyncSession, user: models.User
+    ) -> None:
+        await suggestion_service.skip_suggested_title(sa_async_session, user, 123)
+
+        skips = await sa_async_session.scalars(sa.select(models.TitleSkip))
+        assert list(skips) == []
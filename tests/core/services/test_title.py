@@ -6,7 +6,6 @@ import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models import Genre, Title, TitleType
-from app.core.services import title as title_service
 from app.core.services.title import refresh_from_imdb
 from app.imdb.downloads import Datasets
 from app.testing.constants import (
@@ -15,60 +14,6 @@ from app.testing.constants import (
 )
 
 
-class TestGetByIdOrNone:
-    async def test_returns_title_when_present(
-        self, sa_async_session: AsyncSession, title: Title
-    ) -> None:
-        assert (
-            await title_service.get_by_id_or_none(sa_async_session, title.id) == title
-        )
-
-    async def test_returns_none_when_title_not_found(
-        self, sa_async_session: AsyncSession
-    ) -> None:
-        assert await title_service.get_by_id_or_none(sa_async_session, 123) is None
-
-
-async def test_get_multiple_by_ids(sa_async_session: AsyncSession) -> None:
-    titles = [
-        Title(
-            id=1,
-            title="test1",
-            type=TitleType(name="movie"),
-            start_year=2000,
-            end_year=None,
-            rating=7,
-            votes=10000,
-            genres=set(),
-        ),
-        Title(
-            id=2,
-            title="test2",
-            type=TitleType(name="tvMiniSeries"),
-            start_year=2001,
-            end_year=None,
-            rating=8,
-            votes=10000,
-            genres=set(),
-        ),
-        Title(
-            id=3,
-            title="test3",
-            type=TitleType(name="tvSeries"),
-            start_year=2002,
-            end_year=None,
-            rating=9,
-            votes=10000,
-            genres=set(),
-        ),
-    ]
-    sa_async_session.add_all(titles)
-
-    actual_titles = await title_service.get_multiple_by_ids(sa_async_session, [1, 2])
-
-    assert set(actual_titles) == set(titles[:2])
-
-
 class TestRefreshFromIMDB:
     @pytest.fixture()
     def title_basics_dataset(self) -> str:
@@ -247,6 +192,7 @@ class TestRefreshFromIMDB:
         sa_async_session.add(title_1)
 
         await refresh_from_imdb(sa_async_session)
+        await sa_async_session.refresh(title_1)
 
         assert title_1.start_year == 2000
         assert title_1.rating == 5.7
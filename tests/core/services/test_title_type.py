@@ -1,7 +1,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.models import TitleType
+from app.core.models import TitleType, User
 from app.core.services import title_type as title_type_service
 
 
@@ -24,30 +24,82 @@ async def test_list_all(
     assert await title_type_service.list_all(sa_async_session) == title_type_list
 
 
-async def test_get_by_id(sa_async_session: AsyncSession, title_type: TitleType) -> None:
-    assert (
-        await title_type_service.get_by_id(sa_async_session, title_type.id)
-        == title_type
-    )
+class TestListAllCached:
+    async def test_result_is_cached(
+        self, sa_async_session: AsyncSession, title_type_list: list[TitleType]
+    ) -> None:
+        await title_type_service.list_all_cached(sa_async_session)
+        sa_async_session.add(TitleType(name="test4"))
+        await sa_async_session.commit()
 
+        assert await title_type_service.list_all_cached(sa_async_session) == tuple(
+            title_type_list
+        )
 
-async def test_get_or_create_by_name_when_exists(
-    sa_async_session: AsyncSession, title_type: TitleType
-) -> None:
-    assert (
-        await title_type_service.get_or_create_by_name(
-            session=sa_async_session, name=title_type.name
+    async def test_cache_can_be_invalidated(
+        self, sa_async_session: AsyncSession, title_type_list: list[TitleType]
+    ) -> None:
+        await title_type_service.list_all_cached(sa_async_session)
+        new_title_type = TitleType(name="test4")
+        sa_async_session.add(new_title_type)
+        await sa_async_session.commit()
+
+        title_type_service.invalidate_cache()
+
+        assert await title_type_service.list_all_cached(sa_async_session) == (
+            *title_type_list,
+            new_title_type,
         )
-        == title_type
-    )
 
 
-async def test_get_or_create_by_name_when_not_exists(
-    sa_async_session: AsyncSession,
+async def test_get_or_create_many_by_names(
+    sa_async_session: AsyncSession, title_type: TitleType
 ) -> None:
-    title_type = await title_type_service.get_or_create_by_name(
-        session=sa_async_session, name="test"
+    title_types = await title_type_service.get_or_create_many_by_names(
+        session=sa_async_session, names=[title_type.name, "test"]
     )
 
-    assert title_type.name == "test"
-    assert await title_type_service.list_all(sa_async_session) == [title_type]
+    assert title_types.keys() == {title_type.name, "test"}
+    assert title_types[title_type.name] == title_type
+    assert title_types["test"].id is not None
+    assert set(await title_type_service.list_all(sa_async_session)) == set(
+        title_types.values()
+    )
+
+
+class TestSetSelection:
+    async def test_selects_title_type(
+        self, sa_async_session: AsyncSession, user: User, title_type: TitleType
+    ) -> None:
+        await title_type_service.set_selection(
+            sa_async_session, user.id, title_type.id, True
+        )
+
+        sa_async_session.expire(user, ["selected_title_types"])
+        assert await user.awaitable_attrs.selected_title_types == {title_type}
+
+    async def test_selecting_twice_is_noop(
+        self, sa_async_session: AsyncSession, user: User, title_type: TitleType
+    ) -> None:
+        await title_type_service.set_selection(
+            sa_async_session, user.id, title_type.id, True
+        )
+        await title_type_service.set_selection(
+            sa_async_session, user.id, title_type.id, True
+        )
+
+        sa_async_session.expire(user, ["selected_title_types"])
+        assert await user.awaitable_attrs.selected_title_types == {title_type}
+
+    async def test_deselects_title_type(
+        self, sa_async_session: AsyncSession, user: User, title_type: TitleType
+    ) -> None:
+        (await user.awaitable_attrs.selected_title_types).add(title_type)
+        await sa_async_session.commit()
+
+        await title_type_service.set_selection(
+            sa_async_session, user.id, title_type.id, False
+        )
+
+        sa_async_session.expire(user, ["selected_title_types"])
+        assert await user.awaitable_attrs.selected_title_types == set()
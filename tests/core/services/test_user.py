@@ -1,5 +1,6 @@
 import aiogram
 import pytest
+import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
 
 from app.core import models
@@ -64,3 +65,26 @@ class TestCreateOrUpdateFromData:
         assert user.first_name == user_data.first_name
         assert user.last_name == user_data.last_name
         assert user.username == user_data.username
+
+    async def test_selections_are_loaded_with_user(
+        self,
+        sa_async_session: sa_async.AsyncSession,
+        user_data: aiogram.types.User,
+        user: models.User,
+        genre: models.Genre,
+        title_type: models.TitleType,
+    ) -> None:
+        (await user.awaitable_attrs.selected_genres).add(genre)
+        (await user.awaitable_attrs.selected_title_types).add(title_type)
+        await sa_async_session.commit()
+        sa_async_session.expunge_all()
+
+        user = await user_service.create_or_update_from_data(
+            sa_async_session, user_data
+        )
+
+        unloaded = sa.inspect(user).unloaded
+        assert "selected_genres" not in unloaded
+        assert "selected_title_types" not in unloaded
+        assert user.selected_genres == {genre}
+        assert user.selected_title_types == {title_type}
@@ -4,8 +4,7 @@ import freezegun
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.constants import SKIPPED_TITLE_TIMEOUT
-from app.core.models import Genre, Title, TitleSkip, TitleType, User
+from app.core.models import Genre, Title, TitleType, User
 from app.testing.constants import RANDOM_DATETIME
 
 
@@ -53,98 +52,6 @@ class TestUser:
 
         assert user.last_activity_at == new_activity_at
 
-    @pytest.fixture()
-    async def user(self, sa_async_session: AsyncSession) -> User:
-        user = User(id=1, first_name="test")
-        sa_async_session.add(user)
-        await sa_async_session.flush()
-        await sa_async_session.refresh(user)
-        return user
-
-    async def test_select_genre(
-        self, sa_async_session: AsyncSession, genre: Genre, user: User
-    ) -> None:
-        await user.select_genre(genre)
-
-        assert user.selected_genres == {genre}
-
-    async def test_deselect_genre_with_selected_genre(
-        self, sa_async_session: AsyncSession, genre: Genre, user: User
-    ) -> None:
-        await user.awaitable_attrs.selected_genres  # load selected_genres
-        user.selected_genres = {genre}
-
-        await user.deselect_genre(genre)
-
-        assert user.selected_genres == set()
-
-    async def test_deselect_genre_with_unselected_genre(
-        self, sa_async_session: AsyncSession, genre: Genre, user: User
-    ) -> None:
-        await user.deselect_genre(genre)
-
-        assert user.selected_genres == set()
-
-    async def test_select_title_type(
-        self, sa_async_session: AsyncSession, title_type: TitleType, user: User
-    ) -> None:
-        await user.select_title_type(title_type)
-
-        assert user.selected_title_types == {title_type}
-
-    async def test_deselect_title_type_with_selected_title_type(
-        self, sa_async_session: AsyncSession, title_type: TitleType, user: User
-    ) -> None:
-        await user.awaitable_attrs.selected_title_types  # load selected_title_types
-        user.selected_title_types = {title_type}
-
-        await user.deselect_title_type(title_type)
-
-        assert user.selected_title_types == set()
-
-    async def test_deselect_title_type_with_unselected_title_type(
-        self, sa_async_session: AsyncSession, title_type: TitleType, user: User
-    ) -> None:
-        await user.deselect_title_type(title_type)
-
-        assert user.selected_title_types == set()
-
-    @freezegun.freeze_time(RANDOM_DATETIME)
-    async def test_skip_title_when_not_skipped_yet(
-        self, sa_async_session: AsyncSession, title: Title, user: User
-    ) -> None:
-        await user.skip_title(title)
-
-        await sa_async_session.refresh(user)
-
-        skip = await sa_async_session.get_one(
-            TitleSkip, {"user_id": user.id, "title_id": title.id}
-        )
-        assert skip.expires_at == RANDOM_DATETIME + SKIPPED_TITLE_TIMEOUT
-        assert not skip.is_watched
-
-    @freezegun.freeze_time(RANDOM_DATETIME)
-    async def test_skip_title_when_already_skipped(
-        self, sa_async_session: AsyncSession, title: Title, user: User
-    ) -> None:
-        sa_async_session.add(
-            TitleSkip(
-                title=title,
-                user=user,
-                expires_at=RANDOM_DATETIME + datetime.timedelta(minutes=2),
-            )
-        )
-
-        await user.skip_title(title)
-
-        await sa_async_session.refresh(user)
-
-        skip = await sa_async_session.get_one(
-            TitleSkip, {"user_id": user.id, "title_id": title.id}
-        )
-        assert skip.expires_at == RANDOM_DATETIME + SKIPPED_TITLE_TIMEOUT
-        assert not skip.is_watched
-
 
 class TestGenre:
     def test_hashable(self, genre: Genre) -> None:
@@ -151,3 +151,24 @@ async def test_aiter_title_ratings_dataset(
     ]
 
     assert actual_records == expected_records
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        pytest.param(
+            TITLE_RATINGS_DATASET_HEADER + "tt0000001\t5.7\t2117\n\ntt0000002\t6\t3\n",
+            id="empty line",
+        ),
+        pytest.param(
+            TITLE_RATINGS_DATASET_HEADER + "tt0000001\t5.7\n",
+            id="missing column",
+        ),
+    ],
+)
+async def test_broken_dataset(dataset: str, tmp_file_path: Path) -> None:
+    tmp_file_path.write_text(dataset)
+
+    with pytest.raises(ValueError, match="Dataset is broken"):
+        async for _ in parsers.aiter_title_ratings_dataset(tmp_file_path):
+            pass
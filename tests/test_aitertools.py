@@ -52,3 +52,27 @@ async def test_zip_on_same_ordered_attribute(
     actual_matches = [(v1.attribute, v2.attribute) async for v1, v2 in actual_matches]
 
     assert actual_matches == expected_matches
+
+
+@pytest.mark.parametrize(
+    "values, n, expected_batches",
+    [
+        ([], 2, []),
+        ([1, 2, 3, 4], 2, [[1, 2], [3, 4]]),
+        ([1, 2, 3], 2, [[1, 2], [3]]),
+        ([1, 2, 3], 5, [[1, 2, 3]]),
+    ],
+)
+async def test_batched(
+    values: list[int], n: int, expected_batches: list[list[int]]
+) -> None:
+    actual_batches = [
+        batch async for batch in aitertools.batched(_async_generator(values), n)
+    ]
+
+    assert actual_batches == expected_batches
+
+
+async def test_batched_rejects_non_positive_n() -> None:
+    with pytest.raises(ValueError):
+        await anext(aitertools.batched(_async_generator([1]), 0))
@@ -23,6 +23,11 @@ class TestInitAsync:
             engine.url.render_as_string(hide_password=False) == db_config.sqlalchemy_url
         )
 
+    def test_engine_is_configured_with_pool_options(self, db_config: database.Config):
+        engine, _ = database.init_async(db_config.model_copy(update={"pool_size": 7}))
+
+        assert engine.sync_engine.pool.size() == 7
+
     def test_session_is_configured_with_expire_on_commit_set_to_false(
         self, db_config: database.Config
     ):
@@ -10,7 +10,10 @@ import app.logging
 
 
 @pytest.fixture(autouse=True)
-def reset_logging() -> Generator[None, None, None]:
+def reset_logging(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    # Let monkeypatch restore the level that init() changes.
+    monkeypatch.setattr(app.logging, "_min_level_no", app.logging._min_level_no)
+
     yield
 
     # Reset logging configuration after each test
@@ -75,3 +78,20 @@ class TestInit:
         logging.info("This should be printed")
 
         assert "This should be printed" in output_file.getvalue()
+
+
+class TestIsEnabled:
+    def test_level_below_configured_is_disabled(self):
+        app.logging.init(app.logging.Config(level="INFO"))
+
+        assert not app.logging.is_enabled("DEBUG")
+
+    def test_configured_level_is_enabled(self):
+        app.logging.init(app.logging.Config(level="INFO"))
+
+        assert app.logging.is_enabled("INFO")
+
+    def test_level_above_configured_is_enabled(self):
+        app.logging.init(app.logging.Config(level="DEBUG"))
+
+        assert app.logging.is_enabled("INFO")